@@ -11,8 +11,13 @@ import sys
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, Optional, Any
 
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.http import POLL_BACKOFF_FACTOR, POLL_INITIAL_INTERVAL, create_session
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,13 +43,17 @@ class DremioClient:
         """
         self.host = host
         self.port = port
+        self.use_ssl = use_ssl
         self.base_url = f"{'https' if use_ssl else 'http'}://{host}:{port}/api/v3"
         self.username = username
         self.password = password
         self.token = None
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        # One session per client so every call reuses a kept-alive connection;
+        # retries on transient gateway errors are handled by the session adapter
+        self.session = create_session()
+        # Headers live on the session so they are sent with every request
+        # without being merged into a per-call dict
+        self.session.headers.update({"Content-Type": "application/json"})
     
     def login(self) -> bool:
         """
@@ -60,10 +69,10 @@ class DremioClient:
         }
         
         try:
-            response = requests.post(login_url, headers=self.headers, json=payload)
+            response = self.session.post(login_url, json=payload)
             response.raise_for_status()
             self.token = response.json()["token"]
-            self.headers["Authorization"] = f"_dremio{self.token}"
+            self.session.headers["Authorization"] = f"_dremio{self.token}"
             logger.info(f"Successfully authenticated to Dremio at {self.host}")
             return True
         except Exception as e:
@@ -95,7 +104,7 @@ class DremioClient:
         }
         
         try:
-            response = requests.post(catalog_url, headers=self.headers, json=payload)
+            response = self.session.post(catalog_url, json=payload)
             response.raise_for_status()
             logger.info(f"Successfully created source {source_name}")
             return True
@@ -139,7 +148,7 @@ class DremioClient:
         }
         
         try:
-            response = requests.post(user_url, headers=self.headers, json=payload)
+            response = self.session.post(user_url, json=payload)
             response.raise_for_status()
             logger.info(f"Successfully created user {username}")
             return True
@@ -173,7 +182,7 @@ class DremioClient:
         }
         
         try:
-            response = requests.post(sql_url, headers=self.headers, json=payload)
+            response = self.session.post(sql_url, json=payload)
             response.raise_for_status()
             result = response.json()
             
@@ -192,24 +201,27 @@ class DremioClient:
             logger.error(f"Error executing SQL: {str(e)}")
             return None
     
-    def _poll_job_status(self, job_id: str, timeout: int = 60, interval: int = 1) -> Dict:
+    def _poll_job_status(self, job_id: str, timeout: int = 60, interval: float = 2.0) -> Dict:
         """
         Poll for job status until completion or timeout
         
         Args:
             job_id (str): Job ID to poll
             timeout (int, optional): Timeout in seconds. Defaults to 60.
-            interval (int, optional): Polling interval in seconds. Defaults to 1.
+            interval (float, optional): Maximum polling interval in seconds; the
+                interval grows exponentially from POLL_INITIAL_INTERVAL up to
+                this value. Defaults to 2.0.
         
         Returns:
             Dict: Job status
         """
         job_url = f"{self.base_url}/job/{job_id}"
-        start_time = time.time()
+        start_time = time.monotonic()
+        delay = min(POLL_INITIAL_INTERVAL, interval)
         
         while True:
             try:
-                response = requests.get(job_url, headers=self.headers)
+                response = self.session.get(job_url)
                 response.raise_for_status()
                 job_status = response.json()
                 
@@ -217,16 +229,44 @@ class DremioClient:
                     return job_status
                 
                 # Check timeout
-                if time.time() - start_time > timeout:
+                if time.monotonic() - start_time > timeout:
                     logger.warning(f"Job {job_id} timed out after {timeout} seconds")
                     return {"jobState": "TIMEOUT"}
                 
-                time.sleep(interval)
+                time.sleep(delay)
+                delay = min(delay * POLL_BACKOFF_FACTOR, interval)
             
             except Exception as e:
                 logger.error(f"Error checking job status: {str(e)}")
                 return {"jobState": "ERROR", "error": str(e)}
 
+def dremio_source_config(host: str, port: int, use_ssl: bool,
+                         username: str, password: str) -> Dict[str, Any]:
+    """
+    Build the catalog configuration of a source pointing at another Dremio cluster
+    
+    Args:
+        host (str): Host of the remote Dremio cluster
+        port (int): Port of the remote Dremio cluster
+        use_ssl (bool): Whether the remote cluster uses SSL
+        username (str): Username for the remote cluster
+        password (str): Password for the remote cluster
+    
+    Returns:
+        Dict[str, Any]: Source configuration
+    """
+    return {
+        "type": "DREMIO",
+        "config": {
+            "hostname": host,
+            "port": port,
+            "authenticationType": "BASIC",
+            "username": username,
+            "password": password,
+            "enableSSL": use_ssl
+        }
+    }
+
 def setup_cross_cluster(dremio_a: DremioClient, dremio_b: DremioClient, 
                        dremio_a_host: str, dremio_b_host: str, 
                        cross_user: str, cross_password: str) -> bool:
@@ -244,74 +284,61 @@ def setup_cross_cluster(dremio_a: DremioClient, dremio_b: DremioClient,
     Returns:
         bool: True if successful, False otherwise
     """
-    # Step 1: Create cross-cluster user in both Dremio instances
-    logger.info("Creating cross-cluster user in Dremio A")
-    dremio_a.create_user(
-        username=cross_user,
-        password=cross_password,
-        first_name="Cross",
-        last_name="Cluster",
-        email="cross.cluster@example.com"
-    )
-    
-    logger.info("Creating cross-cluster user in Dremio B")
-    dremio_b.create_user(
-        username=cross_user,
-        password=cross_password,
-        first_name="Cross",
-        last_name="Cluster",
-        email="cross.cluster@example.com"
-    )
-    
-    # Step 2: Configure Dremio B as a source in Dremio A
-    logger.info("Configuring Dremio B as a source in Dremio A")
-    dremio_b_config = {
-        "type": "DREMIO",
-        "config": {
-            "hostname": dremio_b_host,
-            "port": 9047,
-            "authenticationType": "BASIC",
-            "username": cross_user,
-            "password": cross_password,
-            "enableSSL": True
-        }
-    }
-    
-    dremio_a.create_source("DremioB", dremio_b_config)
-    
-    # Step 3: Configure Dremio A as a source in Dremio B
-    logger.info("Configuring Dremio A as a source in Dremio B")
-    dremio_a_config = {
-        "type": "DREMIO",
-        "config": {
-            "hostname": dremio_a_host,
-            "port": 9047,
-            "authenticationType": "BASIC",
-            "username": cross_user,
-            "password": cross_password,
-            "enableSSL": True
-        }
-    }
-    
-    dremio_b.create_source("DremioA", dremio_a_config)
-    
-    # Step 4: Create a virtual dataset for testing cross-cluster access in Dremio A
-    logger.info("Creating a virtual dataset for testing cross-cluster access in Dremio A")
-    test_vds_sql_a = """
-    CREATE VDS IF NOT EXISTS cross_cluster_test AS 
-    SELECT * FROM DremioB.hdfs.tpcds_1gb_parquet.customer LIMIT 10;
-    """
-    
-    dremio_a.execute_sql(test_vds_sql_a)
-    
-    # Step 5: Create a virtual dataset for testing cross-cluster access in Dremio B
-    logger.info("Creating a virtual dataset for testing cross-cluster access in Dremio B")
-    test_vds_sql_b = """
-    CREATE VDS IF NOT EXISTS cross_cluster_test AS 
-    SELECT * FROM DremioA.hdfs.tpcds_1gb_parquet.customer LIMIT 10;
-    """
-    
-    dremio_b.execute_sql(test_vds_sql_b)
+    # Dremio A and Dremio B are independent clusters, so every step is applied
+    # to both of them concurrently instead of one after the other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Step 1: Create cross-cluster user in both Dremio instances
+        logger.info("Creating cross-cluster user in Dremio A and Dremio B")
+        futures = [
+            executor.submit(
+                client.create_user,
+                username=cross_user,
+                password=cross_password,
+                first_name="Cross",
+                last_name="Cluster",
+                email="cross.cluster@example.com"
+            )
+            for client in (dremio_a, dremio_b)
+        ]
+        for future in futures:
+            future.result()
+        
+        # Step 2: Configure Dremio B as a source in Dremio A
+        # Step 3: Configure Dremio A as a source in Dremio B
+        logger.info("Configuring Dremio B as a source in Dremio A and Dremio A as a source in Dremio B")
+        dremio_b_config = dremio_source_config(
+            dremio_b_host, dremio_b.port, dremio_b.use_ssl, cross_user, cross_password
+        )
+        dremio_a_config = dremio_source_config(
+            dremio_a_host, dremio_a.port, dremio_a.use_ssl, cross_user, cross_password
+        )
+        
+        futures = [
+            executor.submit(dremio_a.create_source, "DremioB", dremio_b_config),
+            executor.submit(dremio_b.create_source, "DremioA", dremio_a_config)
+        ]
+        for future in futures:
+            future.result()
+        
+        # Step 4: Create a virtual dataset for testing cross-cluster access in Dremio A
+        # Step 5: Create a virtual dataset for testing cross-cluster access in Dremio B
+        logger.info("Creating virtual datasets for testing cross-cluster access in Dremio A and Dremio B")
+        test_vds_sql_a = """
+        CREATE VDS IF NOT EXISTS cross_cluster_test AS 
+        SELECT * FROM DremioB.hdfs.tpcds_1gb_parquet.customer LIMIT 10;
+        """
+        
+        test_vds_sql_b = """
+        CREATE VDS IF NOT EXISTS cross_cluster_test AS 
+        SELECT * FROM DremioA.hdfs.tpcds_1gb_parquet.customer LIMIT 10;
+        """
+        
+        futures = [
+            executor.submit(dremio_a.execute_sql, test_vds_sql_a),
+            executor.submit(dremio_b.execute_sql, test_vds_sql_b)
+        ]
+        for future in futures:
+            future.result()
     
     logger.info("Cross-cluster setup completed successfully!")
     return True
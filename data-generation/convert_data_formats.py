@@ -6,6 +6,7 @@ This script converts TPC-DS data from raw format to CSV, JSON, Pipe-delimited, O
 """
 
 from pyspark.sql import SparkSession
+import glob
 import os
 import logging
 import sys
@@ -34,6 +35,15 @@ TPC_DS_TABLES = [
 # Output formats
 FORMATS = ["csv", "json", "pipe", "orc", "parquet"]
 
+# DataFrameWriter call for each output format
+FORMAT_WRITERS = {
+    "csv": lambda writer, path: writer.option("header", "true").csv(path),
+    "json": lambda writer, path: writer.json(path),
+    "pipe": lambda writer, path: writer.option("delimiter", "|").option("header", "true").csv(path),
+    "orc": lambda writer, path: writer.orc(path),
+    "parquet": lambda writer, path: writer.parquet(path),
+}
+
 def init_spark():
     """Initialize Spark session"""
     return (
@@ -48,16 +58,19 @@ def convert_table(spark, scale, table, input_dir, output_base_dir):
     """Convert a single table to all formats"""
     logger.info(f"Processing table: {table} at scale {scale}GB")
     
-    # Input file path
+    # Input file path, or the chunk files written by 'dsdgen -PARALLEL n'
     input_path = f"{input_dir}/{scale}gb/{table}.dat"
+    input_paths = [input_path] if os.path.exists(input_path) else sorted(
+        glob.glob(f"{input_dir}/{scale}gb/{table}_[0-9]*_[0-9]*.dat")
+    )
     
-    if not os.path.exists(input_path):
+    if not input_paths:
         logger.error(f"Input file not found: {input_path}")
         return False
     
     try:
         # Read raw data (pipe-delimited)
-        df = spark.read.option("delimiter", "|").option("header", "false").csv(input_path)
+        df = spark.read.option("delimiter", "|").option("header", "false").csv(input_paths)
         
         # Save in each format
         for fmt in FORMATS:
@@ -65,16 +78,7 @@ def convert_table(spark, scale, table, input_dir, output_base_dir):
             
             logger.info(f"Converting {table} to {fmt} format")
             
-            if fmt == "csv":
-                df.write.option("header", "true").csv(output_dir)
-            elif fmt == "json":
-                df.write.json(output_dir)
-            elif fmt == "pipe":
-                df.write.option("delimiter", "|").option("header", "true").csv(output_dir)
-            elif fmt == "orc":
-                df.write.orc(output_dir)
-            elif fmt == "parquet":
-                df.write.parquet(output_dir)
+            FORMAT_WRITERS[fmt](df.write, output_dir)
             
             logger.info(f"Successfully converted {table} to {fmt}")
         
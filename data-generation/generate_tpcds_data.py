@@ -10,10 +10,13 @@ import logging
 import sys
 import platform
 import subprocess
+import tempfile
+import time
 import ctypes
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +29,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bundled dsdgen binary, resolved once at import
+DSDGEN_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "dsdgen",
+    "dsdgen.exe" if platform.system() == "Windows" else "dsdgen"
+)
+
+# Seconds between checks on running dsdgen chunk processes
+CHUNK_POLL_INTERVAL = 0.5
+
+# Seconds a terminated dsdgen process is given to exit before it is killed
+CHUNK_TERMINATE_TIMEOUT = 10
+
 class DataGenerationStrategy(ABC):
     """Abstract base class for platform-specific data generation strategies"""
     
@@ -40,13 +56,15 @@ class DataGenerationStrategy(ABC):
         self.dsdgen_dir = os.path.dirname(dsdgen_path)
     
     @abstractmethod
-    def generate_data(self, output_dir: str, scale_factor: int) -> bool:
+    def generate_data(self, output_dir: str, scale_factor: int, parallel: int = 1) -> bool:
         """
         Generate TPC-DS data using platform-specific approach
         
         Args:
             output_dir: Directory to output generated data
             scale_factor: Scale factor in GB
+            parallel: Number of chunks to generate concurrently with
+                dsdgen -PARALLEL/-CHILD (1 generates a single chunk)
             
         Returns:
             bool: Success status
@@ -56,17 +74,25 @@ class DataGenerationStrategy(ABC):
 class WindowsStrategy(DataGenerationStrategy):
     """Windows-specific data generation strategy"""
     
-    def generate_data(self, output_dir: str, scale_factor: int) -> bool:
+    def __init__(self, dsdgen_path: str):
+        super().__init__(dsdgen_path)
+        self.dsdgen_exe = os.path.join(self.dsdgen_dir, "dsdgen.exe")
+    
+    def generate_data(self, output_dir: str, scale_factor: int, parallel: int = 1) -> bool:
+        # ShellExecute does not wait for dsdgen to exit, so chunks cannot be
+        # coordinated here; data is always generated as a single chunk
+        if parallel > 1:
+            logger.warning("Parallel generation is not supported on Windows, generating a single chunk")
+        
         try:
             # Convert paths to Windows format
-            dsdgen_exe = os.path.join(self.dsdgen_dir, "dsdgen.exe")
             output_dir_win = output_dir.replace('/', '\\')
             
             # Use ctypes to call the executable
             result = ctypes.windll.shell32.ShellExecuteW(
                 None,  # hwnd
                 "open",  # operation
-                dsdgen_exe,  # file
+                self.dsdgen_exe,  # file
                 f'-SCALE {scale_factor} -DIR "{output_dir_win}" -FORCE',  # parameters
                 self.dsdgen_dir,  # directory
                 1  # show command (1 = normal)
@@ -89,7 +115,7 @@ class WindowsStrategy(DataGenerationStrategy):
         """Fallback to subprocess-based generation if native approach fails"""
         try:
             cmd = [
-                os.path.join(self.dsdgen_dir, "dsdgen.exe"),
+                self.dsdgen_exe,
                 "-SCALE", str(scale_factor),
                 "-DIR", output_dir,
                 "-FORCE"
@@ -126,15 +152,18 @@ class LinuxStrategy(DataGenerationStrategy):
         except Exception as e:
             logger.warning(f"Could not make dsdgen executable: {e}")
     
-    def generate_data(self, output_dir: str, scale_factor: int) -> bool:
+    def generate_data(self, output_dir: str, scale_factor: int, parallel: int = 1) -> bool:
+        cmd = [
+            self.dsdgen_path,
+            "-SCALE", str(scale_factor),
+            "-DIR", output_dir,
+            "-FORCE"
+        ]
+        
+        if parallel > 1:
+            return self._generate_chunks(cmd, scale_factor, parallel)
+        
         try:
-            cmd = [
-                self.dsdgen_path,
-                "-SCALE", str(scale_factor),
-                "-DIR", output_dir,
-                "-FORCE"
-            ]
-            
             result = subprocess.run(
                 cmd,
                 check=True,
@@ -151,6 +180,79 @@ class LinuxStrategy(DataGenerationStrategy):
             logger.error(f"stdout: {e.stdout.decode('utf-8')}")
             logger.error(f"stderr: {e.stderr.decode('utf-8')}")
             return False
+    
+    def _generate_chunks(self, cmd: List[str], scale_factor: int, parallel: int) -> bool:
+        """
+        Run one dsdgen process per chunk of the data concurrently
+        
+        Each child writes {table}_{child}_{parallel}.dat files for its share
+        of the rows.
+        
+        Args:
+            cmd: dsdgen command without the chunking options
+            scale_factor: Scale factor in GB
+            parallel: Number of chunks
+            
+        Returns:
+            bool: Success status
+        """
+        processes = []
+        # Output goes to temporary files rather than pipes, so no child can
+        # block on a full pipe while the others are being watched
+        outputs = []
+        try:
+            for child in range(1, parallel + 1):
+                stdout, stderr = tempfile.TemporaryFile(), tempfile.TemporaryFile()
+                outputs.append((stdout, stderr))
+                processes.append(subprocess.Popen(
+                    cmd + ["-PARALLEL", str(parallel), "-CHILD", str(child)],
+                    stdout=stdout,
+                    stderr=stderr,
+                    cwd=self.dsdgen_dir
+                ))
+            
+            # Watch all children together so the first failure is noticed as
+            # soon as it happens, not after every earlier chunk has finished
+            pending = dict(enumerate(processes, start=1))
+            while pending:
+                for child, process in list(pending.items()):
+                    returncode = process.poll()
+                    if returncode is None:
+                        continue
+                    
+                    del pending[child]
+                    if returncode != 0:
+                        stdout, stderr = outputs[child - 1]
+                        stdout.seek(0)
+                        stderr.seek(0)
+                        logger.error(f"Data generation failed for chunk {child} of {parallel}, return code: {returncode}")
+                        logger.error(f"stdout: {stdout.read().decode('utf-8', errors='replace')}")
+                        logger.error(f"stderr: {stderr.read().decode('utf-8', errors='replace')}")
+                        if pending:
+                            logger.error(f"Stopping the remaining {len(pending)} chunk(s)")
+                        return False
+                
+                if pending:
+                    time.sleep(CHUNK_POLL_INTERVAL)
+            
+            logger.info(f"Successfully generated {scale_factor}GB data in {parallel} chunks")
+            return True
+        
+        finally:
+            # Stop children still running after a failure, an error or an
+            # interrupt, so no dsdgen process outlives this call
+            for process in processes:
+                if process.poll() is None:
+                    process.terminate()
+            for process in processes:
+                try:
+                    process.wait(timeout=CHUNK_TERMINATE_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+            for stdout, stderr in outputs:
+                stdout.close()
+                stderr.close()
 
 class DSDGenWrapper:
     """Python wrapper around dsdgen executable"""
@@ -171,26 +273,29 @@ class DSDGenWrapper:
         else:
             return LinuxStrategy(dsdgen_path)
     
-    def generate_data(self, output_dir: str, scale_factor: int) -> bool:
+    def generate_data(self, output_dir: str, scale_factor: int, parallel: int = 1) -> bool:
         """
         Generate TPC-DS data using platform-appropriate strategy
         
         Args:
             output_dir: Directory to output generated data
             scale_factor: Scale factor in GB
+            parallel: Number of chunks to generate concurrently
             
         Returns:
             bool: Success status
         """
-        return self.strategy.generate_data(output_dir, scale_factor)
+        return self.strategy.generate_data(output_dir, scale_factor, parallel)
 
-def generate_tpcds_data(data_dir: str, scale_factor: int) -> bool:
+def generate_tpcds_data(data_dir: str, scale_factor: int, parallel: int = 1) -> bool:
     """
     Generate TPC-DS data at specified scale factor
     
     Args:
         data_dir: Base directory for data
         scale_factor: Scale factor in GB
+        parallel: Number of chunks to generate concurrently with
+            dsdgen -PARALLEL/-CHILD (1 generates a single chunk)
         
     Returns:
         bool: Success status
@@ -200,14 +305,8 @@ def generate_tpcds_data(data_dir: str, scale_factor: int) -> bool:
         os.makedirs(data_dir, exist_ok=True)
         
         # Initialize generator
-        dsdgen_path = os.path.join(
-            os.path.dirname(__file__),
-            "dsdgen",
-            "dsdgen.exe" if platform.system() == "Windows" else "dsdgen"
-        )
-        
-        generator = DSDGenWrapper(dsdgen_path)
-        return generator.generate_data(data_dir, scale_factor)
+        generator = DSDGenWrapper(DSDGEN_PATH)
+        return generator.generate_data(data_dir, scale_factor, parallel)
         
     except Exception as e:
         logger.error(f"Error in data generation process: {e}")
@@ -222,16 +321,29 @@ def main():
     parser.add_argument("--output-dir", default="../data", help="Output directory")
     parser.add_argument("--scale-factors", nargs="+", type=int, default=[1, 10], 
                         help="Scale factors in GB (default: 1 10)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of scale factors to generate concurrently (default: CPU count)")
+    parser.add_argument("--parallel", type=int, default=1,
+                        help="Number of dsdgen chunks generated concurrently per scale factor (default: 1)")
     
     args = parser.parse_args()
     
     logger.info("Starting TPC-DS data generation...")
     
-    for scale in args.scale_factors:
-        success = generate_tpcds_data(args.output_dir, scale)
-        if not success:
+    # Each scale factor is an independent dsdgen process writing to its own
+    # {output_dir}/{scale}gb directory, so they can run side by side
+    def generate_scale(scale: int) -> bool:
+        return generate_tpcds_data(os.path.join(args.output_dir, f"{scale}gb"), scale, args.parallel)
+    
+    jobs = max(1, min(args.jobs, len(args.scale_factors)))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(generate_scale, args.scale_factors))
+    
+    failed = [scale for scale, success in zip(args.scale_factors, results) if not success]
+    if failed:
+        for scale in failed:
             logger.error(f"Failed to generate data for scale factor {scale}GB")
-            sys.exit(1)
+        sys.exit(1)
     
     logger.info("TPC-DS data generation completed successfully!")
 
@@ -9,11 +9,14 @@ import os
 import argparse
 import logging
 import sys
-import requests
 import json
+from pathlib import Path
 from typing import List, Dict, Optional
 import time
 
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.http import POLL_BACKOFF_FACTOR, POLL_INITIAL_INTERVAL, create_session
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +41,15 @@ TPC_DS_TABLES = [
 # Data formats
 FORMATS = ["csv", "json", "pipe", "orc", "parquet"]
 
+# DDL templates; only the schema, table name and table path vary. The REST
+# API runs one statement per job and jobs share no session state (e.g. USE),
+# so each statement stands alone and tables are named with their schema.
+SCHEMA_DDL_TEMPLATE = "CREATE SCHEMA IF NOT EXISTS {schema}"
+TABLE_DDL_TEMPLATE = (
+    "CREATE OR REPLACE TABLE {schema}.{table} AS\n"
+    "SELECT * FROM dfs.hdfs.`{root}/{table}/*`"
+)
+
 class DremioDDL:
     def __init__(self, host: str, port: int, username: str, password: str, use_ssl: bool = True):
         """
@@ -56,9 +68,12 @@ class DremioDDL:
         self.username = username
         self.password = password
         self.token = None
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        # Reuse one connection for every DDL statement instead of a new
+        # TCP/TLS handshake per request
+        self.session = create_session()
+        # Headers live on the session so they are sent with every request
+        # without being merged into a per-call dict
+        self.session.headers.update({"Content-Type": "application/json"})
     
     def login(self) -> bool:
         """
@@ -74,25 +89,25 @@ class DremioDDL:
         }
         
         try:
-            response = requests.post(login_url, headers=self.headers, json=payload)
+            response = self.session.post(login_url, json=payload)
             response.raise_for_status()
             self.token = response.json()["token"]
-            self.headers["Authorization"] = f"_dremio{self.token}"
+            self.session.headers["Authorization"] = f"_dremio{self.token}"
             logger.info(f"Successfully authenticated to Dremio at {self.host}")
             return True
         except Exception as e:
             logger.error(f"Failed to authenticate to Dremio: {str(e)}")
             return False
     
-    def execute_sql(self, sql: str) -> Optional[Dict]:
+    def submit_sql(self, sql: str) -> Optional[str]:
         """
-        Execute a SQL statement in Dremio
+        Submit a SQL statement to Dremio without waiting for it to finish
         
         Args:
-            sql (str): SQL statement to execute
+            sql (str): SQL statement to submit
         
         Returns:
-            Optional[Dict]: Response from Dremio if successful, None otherwise
+            Optional[str]: Job ID if the statement was accepted, None otherwise
         """
         if not self.token:
             if not self.login():
@@ -104,43 +119,115 @@ class DremioDDL:
         }
         
         try:
-            response = requests.post(sql_url, headers=self.headers, json=payload)
+            response = self.session.post(sql_url, json=payload)
             response.raise_for_status()
-            result = response.json()
-            
-            # Poll for job completion
-            job_id = result.get("id")
-            job_status = self._poll_job_status(job_id)
-            
-            if job_status.get("jobState") == "COMPLETED":
-                logger.info(f"SQL executed successfully: {sql[:50]}...")
-                return job_status
-            else:
-                logger.error(f"SQL execution failed: {job_status}")
-                return None
+            return response.json().get("id")
         
         except Exception as e:
             logger.error(f"Error executing SQL: {str(e)}")
             return None
     
-    def _poll_job_status(self, job_id: str, timeout: int = 60, interval: int = 1) -> Dict:
+    def execute_sql(self, sql: str) -> Optional[Dict]:
+        """
+        Execute a SQL statement in Dremio
+        
+        Args:
+            sql (str): SQL statement to execute
+        
+        Returns:
+            Optional[Dict]: Response from Dremio if successful, None otherwise
+        """
+        job_id = self.submit_sql(sql)
+        if not job_id:
+            return None
+        
+        # Poll for job completion
+        job_status = self._poll_job_status(job_id)
+        
+        if job_status.get("jobState") == "COMPLETED":
+            logger.info(f"SQL executed successfully: {sql[:50]}...")
+            return job_status
+        else:
+            logger.error(f"SQL execution failed: {job_status}")
+            return None
+    
+    def wait_for_jobs(self, job_ids: Dict[str, str], timeout: int = 600, interval: float = 2.0) -> Dict[str, Dict]:
+        """
+        Poll several jobs in one sweep until all of them finish or time out
+        
+        Errors while fetching a job's status are logged and the job is polled
+        again on the next sweep until the overall timeout.
+        
+        Args:
+            job_ids (Dict[str, str]): Job IDs keyed by a caller-chosen name
+            timeout (int, optional): Overall timeout in seconds. Defaults to 600.
+            interval (float, optional): Maximum interval in seconds between
+                sweeps. Defaults to 2.0.
+        
+        Returns:
+            Dict[str, Dict]: Final job status keyed by the same names
+        """
+        statuses = {}
+        pending = dict(job_ids)
+        # Last error seen while polling each job; a failed status request does
+        # not end the wait, since the job itself keeps running in Dremio
+        errors = {}
+        start_time = time.monotonic()
+        delay = min(POLL_INITIAL_INTERVAL, interval)
+        
+        while pending:
+            for name, job_id in list(pending.items()):
+                try:
+                    response = self.session.get(f"{self.base_url}/job/{job_id}")
+                    response.raise_for_status()
+                    job_status = response.json()
+                except Exception as e:
+                    logger.warning(f"Error checking status of job {job_id}, will retry: {str(e)}")
+                    errors[name] = str(e)
+                    continue
+                
+                if job_status.get("jobState") in ["COMPLETED", "FAILED", "CANCELED"]:
+                    statuses[name] = job_status
+                    del pending[name]
+            
+            if not pending:
+                break
+            
+            # Check timeout
+            if time.monotonic() - start_time > timeout:
+                for name, job_id in pending.items():
+                    logger.warning(f"Job {job_id} timed out after {timeout} seconds")
+                    statuses[name] = {"jobState": "TIMEOUT"}
+                    if name in errors:
+                        statuses[name]["error"] = errors[name]
+                break
+            
+            time.sleep(delay)
+            delay = min(delay * POLL_BACKOFF_FACTOR, interval)
+        
+        return statuses
+    
+    def _poll_job_status(self, job_id: str, timeout: int = 60, interval: float = 2.0) -> Dict:
         """
         Poll for job status until completion or timeout
         
         Args:
             job_id (str): Job ID to poll
             timeout (int, optional): Timeout in seconds. Defaults to 60.
-            interval (int, optional): Polling interval in seconds. Defaults to 1.
+            interval (float, optional): Maximum polling interval in seconds; the
+                interval grows exponentially from POLL_INITIAL_INTERVAL up to
+                this value. Defaults to 2.0.
         
         Returns:
             Dict: Job status
         """
         job_url = f"{self.base_url}/job/{job_id}"
-        start_time = time.time()
+        start_time = time.monotonic()
+        delay = min(POLL_INITIAL_INTERVAL, interval)
         
         while True:
             try:
-                response = requests.get(job_url, headers=self.headers)
+                response = self.session.get(job_url)
                 response.raise_for_status()
                 job_status = response.json()
                 
@@ -148,17 +235,18 @@ class DremioDDL:
                     return job_status
                 
                 # Check timeout
-                if time.time() - start_time > timeout:
+                if time.monotonic() - start_time > timeout:
                     logger.warning(f"Job {job_id} timed out after {timeout} seconds")
                     return {"jobState": "TIMEOUT"}
                 
-                time.sleep(interval)
+                time.sleep(delay)
+                delay = min(delay * POLL_BACKOFF_FACTOR, interval)
             
             except Exception as e:
                 logger.error(f"Error checking job status: {str(e)}")
                 return {"jobState": "ERROR", "error": str(e)}
 
-def generate_ddl_statements(hdfs_base_path: str, scale_factors: List[int], formats: List[str], tables: List[str]) -> Dict[str, str]:
+def generate_ddl_statements(hdfs_base_path: str, scale_factors: List[int], formats: List[str], tables: List[str]) -> Dict[str, Dict[str, str]]:
     """
     Generate DDL statements for creating TPC-DS tables in Dremio
     
@@ -169,7 +257,8 @@ def generate_ddl_statements(hdfs_base_path: str, scale_factors: List[int], forma
         tables (List[str]): TPC-DS tables
     
     Returns:
-        Dict[str, str]: Dictionary of schema names to SQL statements
+        Dict[str, Dict[str, str]]: Schema names mapped to the CREATE TABLE
+            statement of each of their tables, keyed by qualified table name
     """
     ddl_statements = {}
     
@@ -177,22 +266,61 @@ def generate_ddl_statements(hdfs_base_path: str, scale_factors: List[int], forma
         for fmt in formats:
             # Schema name
             schema_name = f"dfs.hdfs.tpcds_{scale}gb_{fmt}"
+            table_root = f"{hdfs_base_path}/{scale}gb/{fmt}"
             
-            # Initialize SQL for schema
-            sql = f"-- DDL for {schema_name}\n"
-            sql += f"CREATE SCHEMA IF NOT EXISTS {schema_name};\n"
-            sql += f"USE {schema_name};\n\n"
-            
-            # Add table creation statements
-            for table in tables:
-                sql += f"-- {table}\n"
-                sql += f"CREATE OR REPLACE TABLE {table} AS\n"
-                sql += f"SELECT * FROM dfs.hdfs.`{hdfs_base_path}/{scale}gb/{fmt}/{table}/*`;\n\n"
-            
-            ddl_statements[schema_name] = sql
+            ddl_statements[schema_name] = {
+                f"{schema_name}.{table}": TABLE_DDL_TEMPLATE.format(schema=schema_name, table=table, root=table_root)
+                for table in tables
+            }
     
     return ddl_statements
 
+def format_ddl_script(schema_name: str, table_statements: Dict[str, str]) -> str:
+    """
+    Format a schema's DDL statements as a SQL script
+    
+    Args:
+        schema_name (str): Schema name
+        table_statements (Dict[str, str]): CREATE TABLE statements keyed by
+            qualified table name
+    
+    Returns:
+        str: Script creating the schema and then its tables
+    """
+    parts = [f"-- DDL for {schema_name}\n{SCHEMA_DDL_TEMPLATE.format(schema=schema_name)};\n\n"]
+    parts.extend(f"-- {table}\n{sql};\n\n" for table, sql in table_statements.items())
+    return "".join(parts)
+
+def run_ddl_jobs(dremio: DremioDDL, statements: Dict[str, str]) -> List[str]:
+    """
+    Submit statements as separate jobs, then wait for all of them together
+    
+    Args:
+        dremio (DremioDDL): Authenticated Dremio client
+        statements (Dict[str, str]): SQL statements keyed by the name of the
+            object they create
+    
+    Returns:
+        List[str]: Names of the objects whose statement failed
+    """
+    job_ids = {}
+    failed = []
+    for name, sql in statements.items():
+        job_id = dremio.submit_sql(sql)
+        if job_id:
+            job_ids[name] = job_id
+        else:
+            failed.append(name)
+    
+    for name, job_status in dremio.wait_for_jobs(job_ids).items():
+        if job_status.get("jobState") == "COMPLETED":
+            logger.info(f"Created {name}")
+        else:
+            logger.error(f"Failed to create {name}: {job_status}")
+            failed.append(name)
+    
+    return failed
+
 def main():
     """Main function to generate and execute DDL statements"""
     parser = argparse.ArgumentParser(description="Generate and execute Dremio DDL statements")
@@ -227,10 +355,10 @@ def main():
     os.makedirs(args.output_dir, exist_ok=True)
     
     # Write DDL statements to files
-    for schema_name, sql in ddl_statements.items():
+    for schema_name, table_statements in ddl_statements.items():
         file_path = os.path.join(args.output_dir, f"{schema_name}.sql")
         with open(file_path, "w") as f:
-            f.write(sql)
+            f.write(format_ddl_script(schema_name, table_statements))
         logger.info(f"Wrote DDL statements to {file_path}")
     
     # Execute DDL statements in Dremio if requested
@@ -245,11 +373,27 @@ def main():
             use_ssl=not args.no_ssl
         )
         
-        for schema_name, sql in ddl_statements.items():
-            logger.info(f"Executing DDL for {schema_name}")
-            result = dremio.execute_sql(sql)
-            if not result:
-                logger.error(f"Failed to execute DDL for {schema_name}")
+        if dremio.login():
+            # Every statement is its own job. Schemas are created first, as
+            # their tables depend on them; then the tables of every schema
+            # that exists are submitted before waiting on any of them, so
+            # Dremio runs them side by side and all are polled in one sweep.
+            logger.info(f"Creating {len(ddl_statements)} schema(s)")
+            failed = run_ddl_jobs(dremio, {
+                schema_name: SCHEMA_DDL_TEMPLATE.format(schema=schema_name)
+                for schema_name in ddl_statements
+            })
+            
+            table_statements = {
+                table: sql
+                for schema_name, statements in ddl_statements.items() if schema_name not in failed
+                for table, sql in statements.items()
+            }
+            logger.info(f"Creating {len(table_statements)} table(s)")
+            failed.extend(run_ddl_jobs(dremio, table_statements))
+            
+            if failed:
+                logger.error(f"Failed to create {len(failed)} schema(s) or table(s): {', '.join(failed)}")
     
     logger.info("Dremio DDL generation completed!")
 
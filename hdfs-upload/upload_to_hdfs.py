@@ -7,16 +7,20 @@ Uses subprocess to call Hadoop commands directly.
 """
 
 import os
+import logging
 import argparse
 import sys
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 import platform
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.logging_config import setup_logging
+from utils.command import CLOSE_FDS
+from utils.retry import retry_on_failure
 
 # Configure logging
 logger = setup_logging(
@@ -37,21 +41,38 @@ TPC_DS_TABLES = [
 # Data formats
 FORMATS = ["csv", "json", "pipe", "orc", "parquet"]
 
+# Bytes to megabytes, applied as a single multiply
+_MB = 1.0 / (1024 * 1024)
+
+# Number of concurrent 'hadoop fs -put' processes
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Number of tables copied by a single 'hadoop fs -put' process
+DEFAULT_UPLOAD_BATCH_SIZE = 6
+
+# Attempts per HDFS command before giving up on transient failures
+DEFAULT_UPLOAD_TRIES = 3
+
 class HDFSClient:
     """
     HDFS client that uses subprocess to call Hadoop commands directly.
     """
     
-    def __init__(self, hadoop_conf: str, user: str = "hdfs"):
+    def __init__(self, hadoop_conf: str, user: str = "hdfs", hadoop_bin: str = "hadoop"):
         """
         Initialize the HDFS client
         
         Args:
             hadoop_conf: Path to Hadoop configuration
             user: Hadoop user name
+            hadoop_bin: Hadoop executable to run
         """
         self.hadoop_conf = hadoop_conf
         self.user = user
+        self.hadoop_bin = hadoop_bin
+        
+        # Shared prefix of every filesystem command
+        self._fs_cmd = (hadoop_bin, "fs")
         
         # Check if running in WSL
         self.is_wsl = 'microsoft-standard' in platform.uname().release.lower() if platform.system() == 'Linux' else False
@@ -73,7 +94,13 @@ class HDFSClient:
         Verify that Hadoop commands are available in the system path
         """
         try:
-            subprocess.run(["hadoop", "version"], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            subprocess.run(
+                [self.hadoop_bin, "version"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=CLOSE_FDS
+            )
         except (subprocess.CalledProcessError, FileNotFoundError):
             logger.error("Hadoop commands not found. Please ensure Hadoop is installed and available in the system path.")
             raise RuntimeError("Hadoop commands not found. Please ensure Hadoop is installed and available in the system path.")
@@ -98,45 +125,102 @@ class HDFSClient:
             return path
         return path
     
-    def _run_hadoop_command(self, cmd: List[str], description: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    def _run_hadoop_command(
+        self,
+        cmd: List[str],
+        description: str,
+        capture_stdout: bool = True
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Run a Hadoop command using subprocess
         
         Args:
             cmd: Command to run
             description: Description for logging
+            capture_stdout: Capture and return standard output. When False it
+                is discarded; standard error is always kept for diagnostics.
             
         Returns:
-            Tuple of success status, stdout, stderr
+            Tuple of success status, stdout (None if not captured), stderr
         """
         logger.info(f"Running {description}...")
-        logger.debug(f"Command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Command: {' '.join(cmd)}")
         
         try:
             result = subprocess.run(
                 cmd,
                 check=True,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                env=self.env
+                env=self.env,
+                close_fds=CLOSE_FDS,
+                # Output is decoded once, while it is read
+                encoding='utf-8',
+                errors='replace'
             )
             
-            stdout = result.stdout.decode('utf-8')
-            stderr = result.stderr.decode('utf-8')
-            
             logger.info(f"{description} completed successfully")
-            return True, stdout, stderr
+            return True, result.stdout, result.stderr
             
         except subprocess.CalledProcessError as e:
             logger.error(f"{description} failed: {e}")
-            logger.error(f"stdout: {e.stdout.decode('utf-8')}")
-            logger.error(f"stderr: {e.stderr.decode('utf-8')}")
-            return False, e.stdout.decode('utf-8'), e.stderr.decode('utf-8')
+            if capture_stdout:
+                logger.error(f"stdout: {e.stdout}")
+            logger.error(f"stderr: {e.stderr}")
+            return False, e.stdout, e.stderr
             
         except Exception as e:
             logger.error(f"Error running {description}: {str(e)}")
             return False, None, str(e)
     
+    def kinit(self, keytab: str, principal: str) -> bool:
+        """
+        Obtain a Kerberos ticket for the principal from a keytab
+        
+        Args:
+            keytab: Path to the keytab file
+            principal: Kerberos principal
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        # Construct command
+        cmd = [
+            "kinit", "-kt", keytab, principal
+        ]
+        
+        # Execute command
+        success, _, _ = self._run_hadoop_command(
+            cmd,
+            f"Kerberos login as {principal}",
+            capture_stdout=False
+        )
+        
+        return success
+    
+    def mkdirs(self, hdfs_paths: List[str]) -> bool:
+        """
+        Create several directories in HDFS with a single command
+        
+        Args:
+            hdfs_paths: HDFS paths to create
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        # Construct command
+        cmd = [*self._fs_cmd, "-mkdir", "-p", *hdfs_paths]
+        
+        # Execute command
+        success, _, _ = self._run_hadoop_command(
+            cmd,
+            f"Creating {len(hdfs_paths)} HDFS directories",
+            capture_stdout=False
+        )
+        
+        return success
+    
     def mkdir(self, hdfs_path: str) -> bool:
         """
         Create directory in HDFS
@@ -148,14 +232,13 @@ class HDFSClient:
             True if successful, False otherwise
         """
         # Construct command
-        cmd = [
-            "hadoop", "fs", "-mkdir", "-p", hdfs_path
-        ]
+        cmd = [*self._fs_cmd, "-mkdir", "-p", hdfs_path]
         
         # Execute command
         success, _, _ = self._run_hadoop_command(
             cmd,
-            f"Creating HDFS directory: {hdfs_path}"
+            f"Creating HDFS directory: {hdfs_path}",
+            capture_stdout=False
         )
         
         return success
@@ -176,14 +259,13 @@ class HDFSClient:
             local_file = self._convert_wsl_path(local_file)
         
         # Construct command
-        cmd = [
-            "hadoop", "fs", "-put", "-f", local_file, hdfs_file
-        ]
+        cmd = [*self._fs_cmd, "-put", "-f", local_file, hdfs_file]
         
         # Execute command
         success, _, _ = self._run_hadoop_command(
             cmd,
-            f"Uploading file: {local_file} to {hdfs_file}"
+            f"Uploading file: {local_file} to {hdfs_file}",
+            capture_stdout=False
         )
         
         return success
@@ -204,18 +286,147 @@ class HDFSClient:
             local_dir = self._convert_wsl_path(local_dir)
         
         # Construct command
-        cmd = [
-            "hadoop", "fs", "-put", "-f", local_dir, hdfs_dir
-        ]
+        cmd = [*self._fs_cmd, "-put", "-f", local_dir, hdfs_dir]
+        
+        # Execute command
+        success, _, _ = self._run_hadoop_command(
+            cmd,
+            f"Uploading directory: {local_dir} to {hdfs_dir}",
+            capture_stdout=False
+        )
+        
+        return success
+    
+    def upload_paths(self, local_paths: List[str], hdfs_dir: str) -> bool:
+        """
+        Upload several local files or directories into an HDFS directory
+        with a single command
+        
+        Args:
+            local_paths: Local file or directory paths
+            hdfs_dir: Existing HDFS directory to upload into
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        # Convert paths for WSL if needed
+        if self.is_wsl:
+            local_paths = [self._convert_wsl_path(path) for path in local_paths]
+        
+        # Construct command
+        cmd = [*self._fs_cmd, "-put", "-f", *local_paths, hdfs_dir]
         
         # Execute command
         success, _, _ = self._run_hadoop_command(
             cmd,
-            f"Uploading directory: {local_dir} to {hdfs_dir}"
+            f"Uploading {len(local_paths)} paths to {hdfs_dir}",
+            capture_stdout=False
         )
         
         return success
 
+class _ProgressLogger:
+    """Rate-limited progress logger reporting bytes done and an ETA"""
+    
+    def __init__(self, total_bytes: int, interval: float = 30.0):
+        """
+        Initialize the progress logger.
+        
+        Args:
+            total_bytes: Total number of bytes to be processed
+            interval: Minimum number of seconds between progress lines
+        """
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self.done_bytes = 0
+        self.start_time = time.monotonic()
+        self.last_log_time = self.start_time
+    
+    def tick(self, num_bytes: int) -> None:
+        """
+        Record completed work and log progress if the interval has elapsed.
+        
+        The final tick is always logged.
+        
+        Args:
+            num_bytes: Number of bytes just completed
+        """
+        self.done_bytes += num_bytes
+        now = time.monotonic()
+        finished = self.done_bytes >= self.total_bytes
+        if not finished and now - self.last_log_time < self.interval:
+            return
+        
+        self.last_log_time = now
+        elapsed = now - self.start_time
+        rate = self.done_bytes / elapsed if elapsed > 0 else 0
+        eta = (self.total_bytes - self.done_bytes) / rate if rate > 0 else 0
+        percent = 100 * self.done_bytes / self.total_bytes if self.total_bytes else 100
+        logger.info(
+            f"Progress: {self.done_bytes * _MB:.1f}/{self.total_bytes * _MB:.1f} MB "
+            f"({percent:.0f}%) - ETA {int(eta) // 60}m {int(eta) % 60}s "
+            f"@ {rate * _MB:.1f} MB/s"
+        )
+
+def _local_size(path: str) -> int:
+    """
+    Get the size in bytes of a local file or directory tree.
+    
+    Args:
+        path: Local file or directory path
+    
+    Returns:
+        Total size in bytes
+    """
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    
+    # scandir entries carry their type from the directory listing, so only
+    # regular files need a stat call and nothing is stat'ed twice
+    total = 0
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    return total
+
+def _balance_batches(
+    uploads: List[Tuple[str, str, int]],
+    batch_size: int
+) -> List[List[Tuple[str, str, int]]]:
+    """
+    Split uploads into batches of roughly equal total size.
+    
+    Tables are placed largest-first into the lightest batch that still has
+    room, so a few very large tables (e.g. store_sales) are spread across
+    batches instead of ending up together at the tail of the run.
+    
+    Args:
+        uploads: (table, local_path, size) tuples
+        batch_size: Maximum number of tables per batch
+    
+    Returns:
+        Batches ordered by total size, largest first
+    """
+    num_batches = -(-len(uploads) // batch_size)
+    batches = [[] for _ in range(num_batches)]
+    totals = [0] * num_batches
+    
+    for upload in sorted(uploads, key=lambda u: u[2], reverse=True):
+        index = min(
+            (i for i in range(num_batches) if len(batches[i]) < batch_size),
+            key=totals.__getitem__
+        )
+        batches[index].append(upload)
+        totals[index] += upload[2]
+    
+    order = sorted(range(num_batches), key=totals.__getitem__, reverse=True)
+    return [batches[i] for i in order]
+
 def upload_to_hdfs(
     data_dir: str,
     hdfs_target_dir: str,
@@ -224,10 +435,12 @@ def upload_to_hdfs(
     hadoop_conf_dir: str,
     user: str = "hdfs",
     keytab: Optional[str] = None,
-    principal: Optional[str] = None
+    principal: Optional[str] = None,
+    workers: int = DEFAULT_UPLOAD_WORKERS,
+    batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE
 ) -> bool:
     """
-    Upload data to HDFS cluster using Hadoop commands.
+    Upload data for a single scale factor and format to HDFS.
     
     Args:
         data_dir: Path to local data directory
@@ -238,11 +451,61 @@ def upload_to_hdfs(
         user: Hadoop user name
         keytab: Optional path to the keytab file
         principal: Optional Kerberos principal
+        workers: Number of upload commands to run concurrently
+        batch_size: Number of tables uploaded by each command
     
     Returns:
         True if successful, False otherwise
     """
-    logger.info(f"Uploading {scale}GB {format_type} data to HDFS...")
+    return upload_all_to_hdfs(
+        data_dir, hdfs_target_dir, [scale], [format_type], hadoop_conf_dir,
+        user, keytab, principal, workers, batch_size
+    )
+
+def upload_all_to_hdfs(
+    data_dir: str,
+    hdfs_target_dir: str,
+    scale_factors: List[int],
+    formats: List[str],
+    hadoop_conf_dir: str,
+    user: str = "hdfs",
+    keytab: Optional[str] = None,
+    principal: Optional[str] = None,
+    workers: int = DEFAULT_UPLOAD_WORKERS,
+    batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE,
+    hadoop_bin: str = "hadoop",
+    tries: int = DEFAULT_UPLOAD_TRIES
+) -> bool:
+    """
+    Upload data for several scale factors and formats to HDFS in one run.
+    
+    All (scale, format) pairs share one Kerberos login, one directory
+    creation command and one pool of upload commands, instead of paying
+    those costs once per pair.
+    
+    Args:
+        data_dir: Path to local data directory
+        hdfs_target_dir: HDFS target directory
+        scale_factors: Scale factors to upload
+        formats: Data formats to upload
+        hadoop_conf_dir: Path to Hadoop configuration
+        user: Hadoop user name
+        keytab: Optional path to the keytab file
+        principal: Optional Kerberos principal
+        workers: Number of upload commands to run concurrently
+        batch_size: Number of tables uploaded by each command
+        hadoop_bin: Hadoop executable to run
+        tries: Attempts per HDFS command; failed puts and mkdirs are
+            retried with exponential backoff, which is safe because they
+            are idempotent
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info(
+        f"Uploading {', '.join(f'{scale}GB' for scale in scale_factors)} "
+        f"{', '.join(formats)} data to HDFS..."
+    )
     
     # Set environment variables
     old_conf_dir = os.environ.get('HADOOP_CONF_DIR')
@@ -250,33 +513,81 @@ def upload_to_hdfs(
     
     try:
         # Initialize HDFS client
-        hdfs_client = HDFSClient(hadoop_conf=hadoop_conf_dir, user=user)
+        hdfs_client = HDFSClient(hadoop_conf=hadoop_conf_dir, user=user, hadoop_bin=hadoop_bin)
         
-        # Create target directory
-        target_dir = f"{hdfs_target_dir}/{scale}gb/{format_type}"
-        if not hdfs_client.mkdir(target_dir):
+        # Obtain a Kerberos ticket once for every upload that follows
+        if keytab and principal and not hdfs_client.kinit(keytab, principal):
             return False
         
-        # Upload each table
-        for table in TPC_DS_TABLES:
-            logger.info(f"Uploading {table}...")
-            local_path = f"{data_dir}/{scale}gb/{format_type}/{table}"
-            
-            if not os.path.exists(local_path):
-                logger.error(f"Local path does not exist: {local_path}")
-                return False
-            
-            hdfs_path = f"{target_dir}/{table}"
-            
-            # Upload file or directory
-            if os.path.isfile(local_path):
-                if not hdfs_client.upload_file(local_path, hdfs_path):
-                    return False
-            else:
-                if not hdfs_client.upload_directory(local_path, hdfs_path):
-                    return False
-        
-        logger.info(f"Successfully uploaded {scale}GB {format_type} data to HDFS")
+        # Resolve every table path up front so a missing table fails fast
+        uploads_by_target = {}
+        for scale in scale_factors:
+            for format_type in formats:
+                uploads = []
+                for table in TPC_DS_TABLES:
+                    local_path = f"{data_dir}/{scale}gb/{format_type}/{table}"
+                    
+                    if not os.path.exists(local_path):
+                        logger.error(f"Local path does not exist: {local_path}")
+                        return False
+                    
+                    uploads.append((f"{scale}gb/{format_type}/{table}", local_path, _local_size(local_path)))
+                
+                uploads_by_target[f"{hdfs_target_dir}/{scale}gb/{format_type}"] = uploads
+        
+        # Transient HDFS failures only repeat the failed command, not the
+        # whole upload
+        with_retries = retry_on_failure(tries=tries)
+        
+        # Create all target directories
+        if not with_retries(hdfs_client.mkdirs)(list(uploads_by_target)):
+            return False
+        
+        # Group tables so that each 'hadoop fs -put' process, and the JVM
+        # start-up it pays for, copies several tables into a target directory.
+        # Batches are balanced by size and the largest are submitted first so
+        # that one big table does not finish long after everything else.
+        batches = [
+            (target_dir, batch)
+            for target_dir, uploads in uploads_by_target.items()
+            for batch in _balance_batches(uploads, batch_size)
+        ]
+        batches.sort(key=lambda item: sum(size for _, _, size in item[1]), reverse=True)
+        
+        @with_retries
+        def upload_batch(target_dir: str, batch: List[Tuple[str, str, int]]) -> bool:
+            """Upload a batch of table files or directories with one command"""
+            # Skip building the table list when debug output is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Uploading %s (%.2f MB)...",
+                    ", ".join(table for table, _, _ in batch),
+                    sum(size for _, _, size in batch) * _MB
+                )
+            return hdfs_client.upload_paths([local_path for _, local_path, _ in batch], target_dir)
+        
+        # Batches are independent 'hadoop fs -put' processes, so they are
+        # uploaded concurrently rather than one after another
+        failed_tables = []
+        progress = _ProgressLogger(
+            sum(size for uploads in uploads_by_target.values() for _, _, size in uploads)
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(upload_batch, target_dir, batch): batch
+                for target_dir, batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                if not future.result():
+                    failed_tables.extend(table for table, _, _ in batch)
+                progress.tick(sum(size for _, _, size in batch))
+        
+        if failed_tables:
+            logger.error(f"Failed to upload tables: {', '.join(sorted(failed_tables))}")
+            return False
+        
+        logger.info("Successfully uploaded data to HDFS")
         return True
         
     except Exception as e:
@@ -295,26 +606,45 @@ def main():
     parser = argparse.ArgumentParser(description="Upload TPC-DS data to HDFS")
     parser.add_argument("--data-dir", required=True, help="Path to local data directory")
     parser.add_argument("--hdfs-target-dir", required=True, help="HDFS target directory")
-    parser.add_argument("--scale", type=int, required=True, help="Scale factor in GB")
-    parser.add_argument("--format", required=True, help="Data format")
+    parser.add_argument("--scale-factors", "--scale", dest="scale_factors", nargs="+", type=int,
+                        required=True, help="Scale factors in GB")
+    parser.add_argument("--formats", "--format", dest="formats", nargs="+", required=True,
+                        help="Data formats")
     parser.add_argument("--hadoop-conf", required=True, help="Path to Hadoop configuration")
     parser.add_argument("--user", default="hdfs", help="Hadoop user name")
+    parser.add_argument("--tries", type=int, default=DEFAULT_UPLOAD_TRIES,
+                        help=f"Attempts per HDFS command (default: {DEFAULT_UPLOAD_TRIES})")
+    parser.add_argument("--hadoop-bin", default="hadoop", help="Hadoop executable (default: hadoop)")
     parser.add_argument("--keytab", help="Path to keytab file")
     parser.add_argument("--principal", help="Kerberos principal")
+    parser.add_argument("--workers", type=int, default=DEFAULT_UPLOAD_WORKERS,
+                        help=f"Number of concurrent uploads (default: {DEFAULT_UPLOAD_WORKERS})")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_UPLOAD_BATCH_SIZE,
+                        help=f"Number of tables per upload command (default: {DEFAULT_UPLOAD_BATCH_SIZE})")
     
     args = parser.parse_args()
     
+    # Reject counts that would divide by zero or never run a command before
+    # anything is uploaded
+    for option, value in (("--workers", args.workers), ("--batch-size", args.batch_size), ("--tries", args.tries)):
+        if value < 1:
+            parser.error(f"{option} must be at least 1, got {value}")
+    
     logger.info("Starting TPC-DS data upload to HDFS...")
     
-    success = upload_to_hdfs(
+    success = upload_all_to_hdfs(
         args.data_dir,
         args.hdfs_target_dir,
-        args.scale,
-        args.format,
+        args.scale_factors,
+        args.formats,
         args.hadoop_conf,
         args.user,
         args.keytab,
-        args.principal
+        args.principal,
+        args.workers,
+        args.batch_size,
+        args.hadoop_bin,
+        args.tries
     )
     
     if not success:
@@ -7,28 +7,36 @@ This script orchestrates the TPC-DS benchmark process for Dremio.
 
 import os
 import sys
+import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 
-# Add project root to Python path
-sys.path.append(str(Path(__file__).parent))
+# Add project root and script directories to Python path
+PROJECT_ROOT = Path(__file__).parent
+sys.path.append(str(PROJECT_ROOT))
+sys.path.append(str(PROJECT_ROOT / "data-generation"))
+sys.path.append(str(PROJECT_ROOT / "hdfs-upload"))
 
-# Import project modules
+# Import project modules. Step modules are imported where they are used so
+# that '--help' and argument errors do not pay for loading them.
 from utils.logging_config import setup_logging
-from data_generation.generate_tpcds_data import generate_tpcds_data
-from hdfs_upload.upload_to_hdfs import HDFSClient
 
-# Configure logging
-logger = setup_logging(
-    log_file="benchmark.log",
-    module_name="dremio_benchmark.main"
-)
+# Logging is configured in main() once the arguments are known to be valid
+logger = logging.getLogger("dremio_benchmark.main")
 
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Dremio TPC-DS Benchmark Tool")
     
+    parser.add_argument(
+        "--mode",
+        choices=["full", "data-only"],
+        default="full",
+        help="'full' generates and uploads data, 'data-only' only generates it (default: full)"
+    )
+    
     # Data generation options
     parser.add_argument(
         "--scale-factors", 
@@ -37,11 +45,13 @@ def parse_args():
         default=[1, 10], 
         help="Scale factors in GB (default: 1 10)"
     )
+    # Kept so existing command lines still parse; dsdgen only ever produces
+    # pipe-delimited files and nothing is converted to other formats
     parser.add_argument(
         "--formats", 
         nargs="+", 
-        default=["csv", "json", "pipe", "orc", "parquet"], 
-        help="Data formats to generate"
+        help="Deprecated and ignored: data is generated pipe-delimited; "
+             "use data-generation/convert_data_formats.py for other formats"
     )
     parser.add_argument(
         "--data-dir", 
@@ -52,8 +62,7 @@ def parse_args():
     # HDFS options
     parser.add_argument(
         "--hadoop-conf", 
-        required=True, 
-        help="Path to Hadoop configuration"
+        help="Path to Hadoop configuration (required in full mode)"
     )
     parser.add_argument(
         "--hdfs-target-dir", 
@@ -66,7 +75,20 @@ def parse_args():
         help="Hadoop user name"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    # Reject bad input before any data is generated or HDFS is contacted
+    if args.mode == "full" and not args.hadoop_conf:
+        parser.error("--hadoop-conf is required in full mode")
+    
+    invalid = [sf for sf in args.scale_factors if sf <= 0]
+    if invalid:
+        parser.error(f"scale factors must be positive: {', '.join(map(str, invalid))}")
+    
+    # Duplicates would run two dsdgen processes into the same directory
+    args.scale_factors = list(dict.fromkeys(args.scale_factors))
+    
+    return args
 
 def main():
     """
@@ -74,31 +96,68 @@ def main():
     """
     args = parse_args()
     
+    setup_logging(
+        log_file="benchmark.log",
+        module_name="dremio_benchmark.main"
+    )
+    
+    if args.formats:
+        logger.warning("--formats is deprecated and ignored; data is generated pipe-delimited")
+    
     try:
-        # Generate TPC-DS data
         logger.info("Starting Dremio TPC-DS benchmark...")
-        data_dir = os.path.join(args.data_dir, f"tpcds_{args.scale_factors[0]}gb")
         
-        # Generate data
-        from data_generation.generate_tpcds_data import generate_tpcds_data
-        if not generate_tpcds_data(args.scale_factors[0], data_dir, args.formats[0]):
-            logger.error("Failed to generate TPC-DS data")
-            return False
-            
-        # Upload to HDFS if target directory is specified
-        if args.hdfs_target_dir:
-            from hdfs_upload.upload_to_hdfs import HDFSClient
+        from generate_tpcds_data import generate_tpcds_data
+        
+        hdfs_client = None
+        if args.mode == "full" and args.hdfs_target_dir:
+            from upload_to_hdfs import HDFSClient
             try:
                 hdfs_client = HDFSClient(hadoop_conf=args.hadoop_conf, user=args.user)
-                hdfs_client.upload_directory(data_dir, args.hdfs_target_dir)
-                logger.info(f"Successfully uploaded data to HDFS: {args.hdfs_target_dir}")
             except RuntimeError as e:
                 logger.error(f"Failed to upload to HDFS: {str(e)}")
                 return False
-            except Exception as e:
-                logger.error(f"Unexpected error during HDFS upload: {str(e)}")
+            
+            if not hdfs_client.mkdir(args.hdfs_target_dir):
+                logger.error(f"Failed to create HDFS directory: {args.hdfs_target_dir}")
                 return False
+        
+        def generate(scale_factor: int) -> str:
+            """Generate data for one scale factor and return its directory"""
+            data_dir = os.path.join(args.data_dir, f"tpcds_{scale_factor}gb")
+            if not generate_tpcds_data(data_dir, scale_factor):
+                raise RuntimeError(f"Failed to generate TPC-DS data for scale factor {scale_factor}GB")
+            return data_dir
+        
+        def upload(data_dir: str) -> None:
+            """Upload one generated data directory to HDFS"""
+            if not hdfs_client.upload_directory(data_dir, args.hdfs_target_dir):
+                raise RuntimeError(f"Failed to upload {data_dir} to HDFS: {args.hdfs_target_dir}")
+            logger.info(f"Successfully uploaded {data_dir} to HDFS: {args.hdfs_target_dir}")
+        
+        # Scale factors are generated concurrently. Each upload is submitted
+        # as soon as its data is ready, so uploads overlap with generation of
+        # the remaining scale factors.
+        workers = min(len(args.scale_factors), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as generate_pool, \
+                ThreadPoolExecutor(max_workers=workers) as upload_pool:
+            pending = {generate_pool.submit(generate, sf) for sf in args.scale_factors}
+            
+            try:
+                for future in as_completed(list(pending)):
+                    data_dir = future.result()
+                    if hdfs_client:
+                        pending.add(upload_pool.submit(upload, data_dir))
                 
+                for future in as_completed(pending):
+                    future.result()
+            
+            except Exception as e:
+                logger.error(str(e))
+                for future in pending:
+                    future.cancel()
+                return False
+        
         logger.info("Benchmark completed successfully")
         return True
         
@@ -8,26 +8,40 @@ This script generates performance reports from benchmark results
 import argparse
 import logging
 import sys
+import base64
 import csv
+import html
+import io
 import json
 import os
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+import matplotlib
+# Charts are only ever written to files, so use the non-interactive backend
+# rather than probing for a GUI toolkit on import
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import List, Dict, Optional
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("report_generation.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Result columns used by the report and their Arrow types; the rest (notably
+# the full query text) are skipped while parsing. Query names and statuses
+# repeat for every iteration, so they are read dictionary-encoded and arrive
+# in pandas as categoricals, making grouping on them an integer operation.
+# Metrics are read as float32, which is ample precision for timings and
+# resource counters and halves the data moved by the groupby and the charts.
+RESULT_COLUMN_TYPES = {
+    "query_name": pa.dictionary(pa.int32(), pa.string()),
+    "status": pa.dictionary(pa.int32(), pa.string()),
+    "execution_time": pa.float32(),
+    "memory_used": pa.float32(),
+    "cpu_used": pa.float32(),
+    "io_used": pa.float32()
+}
+
 def load_benchmark_results(results_file: str) -> pd.DataFrame:
     """
     Load benchmark results from CSV file
@@ -39,7 +53,20 @@ def load_benchmark_results(results_file: str) -> pd.DataFrame:
         pd.DataFrame: DataFrame containing benchmark results
     """
     try:
-        df = pd.read_csv(results_file)
+        # Arrow's multi-threaded reader parses straight into typed columns.
+        # Query text may span lines, and profile metrics are absent from the
+        # file when no query completed, in which case they are read as nulls.
+        table = pacsv.read_csv(
+            results_file,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=list(RESULT_COLUMN_TYPES),
+                include_missing_columns=True,
+                column_types=RESULT_COLUMN_TYPES
+            )
+        )
+        df = table.to_pandas(self_destruct=True, split_blocks=True)
+        
         logger.info(f"Loaded {len(df)} benchmark results from {results_file}")
         return df
     except Exception as e:
@@ -56,52 +83,46 @@ def generate_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame containing summary statistics
     """
-    # Group by query_name and calculate statistics
-    summary = df.groupby('query_name').agg({
-        'execution_time': ['mean', 'min', 'max', 'std', 'count'],
-        'memory_used': ['mean', 'max'],
-        'cpu_used': ['mean', 'max'],
-        'io_used': ['mean', 'max'],
-        'status': lambda x: (x == 'COMPLETED').mean() * 100  # Success rate as percentage
-    })
-    
-    # Flatten multi-index columns
-    summary.columns = ['_'.join(col).strip() for col in summary.columns.values]
-    
-    # Rename columns for clarity
-    summary = summary.rename(columns={
-        'execution_time_mean': 'avg_execution_time',
-        'execution_time_min': 'min_execution_time',
-        'execution_time_max': 'max_execution_time',
-        'execution_time_std': 'std_execution_time',
-        'execution_time_count': 'run_count',
-        'memory_used_mean': 'avg_memory_used',
-        'memory_used_max': 'max_memory_used',
-        'cpu_used_mean': 'avg_cpu_used',
-        'cpu_used_max': 'max_cpu_used',
-        'io_used_mean': 'avg_io_used',
-        'io_used_max': 'max_io_used',
-        'status_<lambda>': 'success_rate'
-    })
+    # Flag completed runs up front so the success rate is a plain mean
+    # rather than a Python callback invoked once per group
+    df = df.assign(_completed=(df['status'] == 'COMPLETED').astype('uint8'))
+    
+    # Group by query_name and calculate all statistics in a single pass,
+    # naming the output columns directly
+    summary = df.groupby('query_name', observed=True).agg(
+        avg_execution_time=('execution_time', 'mean'),
+        min_execution_time=('execution_time', 'min'),
+        max_execution_time=('execution_time', 'max'),
+        std_execution_time=('execution_time', 'std'),
+        run_count=('execution_time', 'count'),
+        avg_memory_used=('memory_used', 'mean'),
+        max_memory_used=('memory_used', 'max'),
+        avg_cpu_used=('cpu_used', 'mean'),
+        max_cpu_used=('cpu_used', 'max'),
+        avg_io_used=('io_used', 'mean'),
+        max_io_used=('io_used', 'max'),
+        success_rate=('_completed', 'mean')
+    )
+    summary['success_rate'] *= 100  # Success rate as percentage
+    
+    # Plain string index so summaries of different runs, whose categories
+    # differ, still align by query name
+    summary.index = summary.index.astype(str)
     
     return summary
 
-def generate_comparison_report(df_a: pd.DataFrame, df_b: pd.DataFrame, report_name: str) -> pd.DataFrame:
+def generate_comparison_report(summary_a: pd.DataFrame, summary_b: pd.DataFrame, report_name: str) -> pd.DataFrame:
     """
     Generate a comparison report between two benchmark results
     
     Args:
-        df_a (pd.DataFrame): DataFrame containing benchmark results for cluster A
-        df_b (pd.DataFrame): DataFrame containing benchmark results for cluster B
+        summary_a (pd.DataFrame): Summary statistics for cluster A
+        summary_b (pd.DataFrame): Summary statistics for cluster B
         report_name (str): Name of the report
     
     Returns:
         pd.DataFrame: DataFrame containing comparison results
     """
-    # Generate summary statistics for each cluster
-    summary_a = generate_summary_statistics(df_a)
-    summary_b = generate_summary_statistics(df_b)
-    
     # Calculate performance differences
     comparison = pd.DataFrame()
     comparison['query_name'] = summary_a.index
@@ -123,7 +144,41 @@ def generate_comparison_report(df_a: pd.DataFrame, df_b: pd.DataFrame, report_na
     
     return comparison
 
-def generate_charts(df: pd.DataFrame, output_dir: str, prefix: str = ""):
+def _reset_axes(fig: plt.Figure) -> plt.Axes:
+    """
+    Clear a reused figure and give it a single fresh set of axes
+    
+    Args:
+        fig (plt.Figure): Figure to reuse
+    
+    Returns:
+        plt.Axes: New axes on the figure
+    """
+    fig.clear()
+    return fig.add_subplot()
+
+def _save_chart(fig: plt.Figure, output_dir: str, filename: str, images: Optional[Dict[str, str]] = None):
+    """
+    Lay out and save a chart, either to a file or in memory
+    
+    Args:
+        fig (plt.Figure): Figure to save
+        output_dir (str): Directory to save the chart in
+        filename (str): Chart filename
+        images (Optional[Dict[str, str]], optional): When given, the chart is
+            stored in it as a base64 PNG data URI keyed by filename instead of
+            being written to disk. Defaults to None.
+    """
+    fig.tight_layout()
+    if images is None:
+        fig.savefig(os.path.join(output_dir, filename))
+        return
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    images[filename] = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+def generate_charts(df: pd.DataFrame, output_dir: str, prefix: str = "", inline: bool = False) -> Dict[str, str]:
     """
     Generate charts from benchmark results
     
@@ -131,105 +186,169 @@ def generate_charts(df: pd.DataFrame, output_dir: str, prefix: str = ""):
         df (pd.DataFrame): DataFrame containing benchmark results
         output_dir (str): Directory to save charts
         prefix (str, optional): Prefix for chart filenames. Defaults to "".
+        inline (bool, optional): Render charts in memory instead of saving
+            them. Defaults to False.
+    
+    Returns:
+        Dict[str, str]: Base64 PNG data URIs keyed by chart filename when
+            inline, otherwise empty
     """
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # 1. Execution Time by Query
-    plt.figure(figsize=(12, 6))
-    chart = sns.barplot(x=df.index, y='avg_execution_time', data=df)
-    chart.set_xticklabels(chart.get_xticklabels(), rotation=90)
-    plt.title('Average Execution Time by Query')
-    plt.ylabel('Execution Time (seconds)')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, f"{prefix}execution_time.png"))
-    plt.close()
-    
-    # 2. Memory Usage by Query
-    plt.figure(figsize=(12, 6))
-    chart = sns.barplot(x=df.index, y='avg_memory_used', data=df)
-    chart.set_xticklabels(chart.get_xticklabels(), rotation=90)
-    plt.title('Average Memory Usage by Query')
-    plt.ylabel('Memory Usage')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, f"{prefix}memory_usage.png"))
-    plt.close()
-    
-    # 3. CPU Usage by Query
-    plt.figure(figsize=(12, 6))
-    chart = sns.barplot(x=df.index, y='avg_cpu_used', data=df)
-    chart.set_xticklabels(chart.get_xticklabels(), rotation=90)
-    plt.title('Average CPU Usage by Query')
-    plt.ylabel('CPU Usage')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, f"{prefix}cpu_usage.png"))
-    plt.close()
-    
-    # 4. Success Rate by Query
-    plt.figure(figsize=(12, 6))
-    chart = sns.barplot(x=df.index, y='success_rate', data=df)
-    chart.set_xticklabels(chart.get_xticklabels(), rotation=90)
-    plt.title('Success Rate by Query')
-    plt.ylabel('Success Rate (%)')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, f"{prefix}success_rate.png"))
-    plt.close()
+    images = {} if inline else None
+    if not inline:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    # All charts share the same size, so one figure is cleared and redrawn
+    # for each of them instead of creating and tearing down a figure per chart
+    fig = plt.figure(figsize=(12, 6))
+    try:
+        # 1. Execution Time by Query
+        ax = _reset_axes(fig)
+        ax.bar(df.index, df['avg_execution_time'])
+        ax.tick_params(axis='x', labelrotation=90)
+        ax.set_title('Average Execution Time by Query')
+        ax.set_ylabel('Execution Time (seconds)')
+        _save_chart(fig, output_dir, f"{prefix}execution_time.png", images)
+        
+        # 2. Memory Usage by Query
+        ax = _reset_axes(fig)
+        ax.bar(df.index, df['avg_memory_used'])
+        ax.tick_params(axis='x', labelrotation=90)
+        ax.set_title('Average Memory Usage by Query')
+        ax.set_ylabel('Memory Usage')
+        _save_chart(fig, output_dir, f"{prefix}memory_usage.png", images)
+        
+        # 3. CPU Usage by Query
+        ax = _reset_axes(fig)
+        ax.bar(df.index, df['avg_cpu_used'])
+        ax.tick_params(axis='x', labelrotation=90)
+        ax.set_title('Average CPU Usage by Query')
+        ax.set_ylabel('CPU Usage')
+        _save_chart(fig, output_dir, f"{prefix}cpu_usage.png", images)
+        
+        # 4. Success Rate by Query
+        ax = _reset_axes(fig)
+        ax.bar(df.index, df['success_rate'])
+        ax.tick_params(axis='x', labelrotation=90)
+        ax.set_title('Success Rate by Query')
+        ax.set_ylabel('Success Rate (%)')
+        _save_chart(fig, output_dir, f"{prefix}success_rate.png", images)
+    finally:
+        plt.close(fig)
+    
+    return images or {}
 
-def generate_comparison_charts(comparison_df: pd.DataFrame, output_dir: str):
+def generate_comparison_charts(comparison_df: pd.DataFrame, output_dir: str, inline: bool = False) -> Dict[str, str]:
     """
     Generate comparison charts between two benchmark results
     
     Args:
         comparison_df (pd.DataFrame): DataFrame containing comparison results
         output_dir (str): Directory to save charts
+        inline (bool, optional): Render charts in memory instead of saving
+            them. Defaults to False.
+    
+    Returns:
+        Dict[str, str]: Base64 PNG data URIs keyed by chart filename when
+            inline, otherwise empty
     """
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # 1. Execution Time Comparison
-    plt.figure(figsize=(12, 6))
-    comparison_df[['a_avg_time', 'b_avg_time']].plot(kind='bar', figsize=(12, 6))
-    plt.title('Execution Time Comparison (A vs B)')
-    plt.ylabel('Execution Time (seconds)')
-    plt.xticks(rotation=90)
-    plt.legend(['Cluster A', 'Cluster B'])
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "time_comparison.png"))
-    plt.close()
-    
-    # 2. Performance Difference Percentage
-    plt.figure(figsize=(12, 6))
-    sns.barplot(x=comparison_df.index, y='time_diff_pct', data=comparison_df)
-    plt.title('Performance Difference (B vs A)')
-    plt.ylabel('Difference (%)')
-    plt.axhline(y=0, color='r', linestyle='-')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "performance_diff.png"))
-    plt.close()
-    
-    # 3. Memory Usage Comparison
-    plt.figure(figsize=(12, 6))
-    comparison_df[['a_avg_memory', 'b_avg_memory']].plot(kind='bar', figsize=(12, 6))
-    plt.title('Memory Usage Comparison (A vs B)')
-    plt.ylabel('Memory Usage')
-    plt.xticks(rotation=90)
-    plt.legend(['Cluster A', 'Cluster B'])
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "memory_comparison.png"))
-    plt.close()
-    
-    # 4. Success Rate Comparison
-    plt.figure(figsize=(12, 6))
-    comparison_df[['a_success_rate', 'b_success_rate']].plot(kind='bar', figsize=(12, 6))
-    plt.title('Success Rate Comparison (A vs B)')
-    plt.ylabel('Success Rate (%)')
-    plt.xticks(rotation=90)
-    plt.legend(['Cluster A', 'Cluster B'])
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "success_rate_comparison.png"))
-    plt.close()
+    images = {} if inline else None
+    if not inline:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    # Drawing onto one reused figure also stops DataFrame.plot from opening
+    # a second figure next to an empty one for every chart
+    fig = plt.figure(figsize=(12, 6))
+    try:
+        # 1. Execution Time Comparison
+        ax = _reset_axes(fig)
+        comparison_df[['a_avg_time', 'b_avg_time']].plot(kind='bar', ax=ax)
+        ax.set_title('Execution Time Comparison (A vs B)')
+        ax.set_ylabel('Execution Time (seconds)')
+        ax.tick_params(axis='x', labelrotation=90)
+        ax.legend(['Cluster A', 'Cluster B'])
+        _save_chart(fig, output_dir, "time_comparison.png", images)
+        
+        # 2. Performance Difference Percentage
+        ax = _reset_axes(fig)
+        ax.bar(comparison_df.index, comparison_df['time_diff_pct'])
+        ax.set_title('Performance Difference (B vs A)')
+        ax.set_ylabel('Difference (%)')
+        ax.axhline(y=0, color='r', linestyle='-')
+        ax.tick_params(axis='x', labelrotation=90)
+        _save_chart(fig, output_dir, "performance_diff.png", images)
+        
+        # 3. Memory Usage Comparison
+        ax = _reset_axes(fig)
+        comparison_df[['a_avg_memory', 'b_avg_memory']].plot(kind='bar', ax=ax)
+        ax.set_title('Memory Usage Comparison (A vs B)')
+        ax.set_ylabel('Memory Usage')
+        ax.tick_params(axis='x', labelrotation=90)
+        ax.legend(['Cluster A', 'Cluster B'])
+        _save_chart(fig, output_dir, "memory_comparison.png", images)
+        
+        # 4. Success Rate Comparison
+        ax = _reset_axes(fig)
+        comparison_df[['a_success_rate', 'b_success_rate']].plot(kind='bar', ax=ax)
+        ax.set_title('Success Rate Comparison (A vs B)')
+        ax.set_ylabel('Success Rate (%)')
+        ax.tick_params(axis='x', labelrotation=90)
+        ax.legend(['Cluster A', 'Cluster B'])
+        _save_chart(fig, output_dir, "success_rate_comparison.png", images)
+    finally:
+        plt.close(fig)
+    
+    return images or {}
+
+# Columns of the HTML report tables and their headings
+DETAIL_COLUMNS = {
+    'avg_execution_time': 'Avg Time (s)',
+    'min_execution_time': 'Min Time (s)',
+    'max_execution_time': 'Max Time (s)',
+    'std_execution_time': 'Std Dev',
+    'avg_memory_used': 'Avg Memory',
+    'avg_cpu_used': 'Avg CPU',
+    'success_rate': 'Success Rate'
+}
+COMPARISON_COLUMNS = {
+    'a_avg_time': 'A Avg Time (s)',
+    'b_avg_time': 'B Avg Time (s)',
+    'time_diff': 'Time Diff (s)',
+    'time_diff_pct': 'Time Diff (%)',
+    'a_avg_memory': 'A Memory',
+    'b_avg_memory': 'B Memory',
+    'memory_diff_pct': 'Memory Diff (%)'
+}
+
+# Charts shown in the HTML report as (filename, heading)
+CLUSTER_CHARTS = [
+    ("execution_time.png", "Execution Time by Query"),
+    ("memory_usage.png", "Memory Usage by Query"),
+    ("cpu_usage.png", "CPU Usage by Query"),
+    ("success_rate.png", "Success Rate by Query")
+]
+COMPARISON_CHARTS = [
+    ("time_comparison.png", "Execution Time Comparison"),
+    ("performance_diff.png", "Performance Difference"),
+    ("memory_comparison.png", "Memory Usage Comparison"),
+    ("success_rate_comparison.png", "Success Rate Comparison")
+]
+
+def _format_diff(value: float, suffix: str = "") -> str:
+    """
+    Format a B-vs-A difference, highlighting whether B is better or worse
+    
+    Args:
+        value (float): Difference; negative means B is faster
+        suffix (str, optional): Unit appended to the value. Defaults to "".
+    
+    Returns:
+        str: HTML fragment for the table cell
+    """
+    css_class = "good" if value < 0 else "bad" if value > 0 else ""
+    return f'<span class="{css_class}">{value:.2f}{suffix}</span>'
 
 def generate_html_report(summary_df: pd.DataFrame, comparison_df: Optional[pd.DataFrame], 
-                        output_file: str, title: str):
+                        output_file: str, title: str, charts: Optional[Dict[str, str]] = None):
     """
     Generate an HTML report from benchmark results
     
@@ -238,9 +357,13 @@ def generate_html_report(summary_df: pd.DataFrame, comparison_df: Optional[pd.Da
         comparison_df (Optional[pd.DataFrame]): DataFrame containing comparison results
         output_file (str): Path to output HTML file
         title (str): Report title
+        charts (Optional[Dict[str, str]], optional): Inline chart images keyed
+            by chart filename; charts not in it are linked from the charts
+            directory. Defaults to None.
     """
-    # Create HTML header and style
-    html = f"""
+    # Create HTML header and style. Fragments are collected and joined once
+    # at the end; growing a single string with += copies it for every row.
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -261,10 +384,10 @@ def generate_html_report(summary_df: pd.DataFrame, comparison_df: Optional[pd.Da
     <body>
         <h1>{title}</h1>
         <p>Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    """
+    """]
     
     # Add summary section
-    html += """
+    parts.append("""
         <div class="summary">
             <h2>Performance Summary</h2>
             <table>
@@ -272,14 +395,14 @@ def generate_html_report(summary_df: pd.DataFrame, comparison_df: Optional[pd.Da
                     <th>Metric</th>
                     <th>Value</th>
                 </tr>
-    """
+    """)
     
     # Add overall statistics
     total_queries = len(summary_df)
     avg_execution_time = summary_df['avg_execution_time'].mean()
     success_rate = summary_df['success_rate'].mean()
     
-    html += f"""
+    parts.append(f"""
                 <tr>
                     <td>Total Queries</td>
                     <td>{total_queries}</td>
@@ -292,149 +415,95 @@ def generate_html_report(summary_df: pd.DataFrame, comparison_df: Optional[pd.Da
                     <td>Overall Success Rate</td>
                     <td>{success_rate:.2f}%</td>
                 </tr>
-    """
+    """)
     
-    html += """
+    parts.append("""
             </table>
         </div>
-    """
-    
-    # Add detailed results section
-    html += """
+    """)
+    
+    # Add detailed results section; pandas renders the rows instead of a
+    # Python loop formatting every cell
+    detailed = summary_df[list(DETAIL_COLUMNS)].rename(columns=DETAIL_COLUMNS).rename_axis('Query')
+    detailed_table = detailed.reset_index().to_html(
+        index=False,
+        border=0,
+        float_format='{:.2f}'.format,
+        formatters={'Success Rate': '{:.2f}%'.format}
+    )
+    parts.append(f"""
         <div class="detailed-results">
             <h2>Detailed Query Results</h2>
-            <table>
-                <tr>
-                    <th>Query</th>
-                    <th>Avg Time (s)</th>
-                    <th>Min Time (s)</th>
-                    <th>Max Time (s)</th>
-                    <th>Std Dev</th>
-                    <th>Avg Memory</th>
-                    <th>Avg CPU</th>
-                    <th>Success Rate</th>
-                </tr>
-    """
-    
-    # Add a row for each query
-    for query, row in summary_df.iterrows():
-        html += f"""
-                <tr>
-                    <td>{query}</td>
-                    <td>{row['avg_execution_time']:.2f}</td>
-                    <td>{row['min_execution_time']:.2f}</td>
-                    <td>{row['max_execution_time']:.2f}</td>
-                    <td>{row['std_execution_time']:.2f}</td>
-                    <td>{row['avg_memory_used']:.2f}</td>
-                    <td>{row['avg_cpu_used']:.2f}</td>
-                    <td>{row['success_rate']:.2f}%</td>
-                </tr>
-        """
-    
-    html += """
-            </table>
+            {detailed_table}
         </div>
-    """
+    """)
     
     # Add comparison section if available
     if comparison_df is not None:
-        html += """
+        comparison = comparison_df[list(COMPARISON_COLUMNS)].rename(columns=COMPARISON_COLUMNS).rename_axis('Query')
+        
+        # Time differences carry markup highlighting whether B is better or
+        # worse, so escaping is off and the query names are escaped explicitly
+        comparison_table = comparison.reset_index().to_html(
+            index=False,
+            border=0,
+            escape=False,
+            float_format='{:.2f}'.format,
+            formatters={
+                'Query': html.escape,
+                'Time Diff (s)': _format_diff,
+                'Time Diff (%)': lambda value: _format_diff(value, '%'),
+                'Memory Diff (%)': '{:.2f}%'.format
+            }
+        )
+        parts.append(f"""
             <div class="comparison">
                 <h2>Cluster Comparison</h2>
-                <table>
-                    <tr>
-                        <th>Query</th>
-                        <th>A Avg Time (s)</th>
-                        <th>B Avg Time (s)</th>
-                        <th>Time Diff (s)</th>
-                        <th>Time Diff (%)</th>
-                        <th>A Memory</th>
-                        <th>B Memory</th>
-                        <th>Memory Diff (%)</th>
-                    </tr>
-        """
-        
-        # Add a row for each query comparison
-        for query, row in comparison_df.iterrows():
-            # Determine if B is better (negative diff) or worse (positive diff)
-            time_diff_class = "good" if row['time_diff'] < 0 else "bad" if row['time_diff'] > 0 else ""
-            
-            html += f"""
-                    <tr>
-                        <td>{query}</td>
-                        <td>{row['a_avg_time']:.2f}</td>
-                        <td>{row['b_avg_time']:.2f}</td>
-                        <td class="{time_diff_class}">{row['time_diff']:.2f}</td>
-                        <td class="{time_diff_class}">{row['time_diff_pct']:.2f}%</td>
-                        <td>{row['a_avg_memory']:.2f}</td>
-                        <td>{row['b_avg_memory']:.2f}</td>
-                        <td>{row['memory_diff_pct']:.2f}%</td>
-                    </tr>
-            """
-        
-        html += """
-                </table>
+                {comparison_table}
             </div>
-        """
+        """)
     
-    # Add chart section - these would be links to the generated chart images
-    if comparison_df is not None:
-        html += """
-            <div class="charts">
-                <h2>Performance Charts</h2>
-                <div class="chart">
-                    <h3>Execution Time Comparison</h3>
-                    <img src="charts/time_comparison.png" alt="Execution Time Comparison">
-                </div>
-                <div class="chart">
-                    <h3>Performance Difference</h3>
-                    <img src="charts/performance_diff.png" alt="Performance Difference">
-                </div>
-                <div class="chart">
-                    <h3>Memory Usage Comparison</h3>
-                    <img src="charts/memory_comparison.png" alt="Memory Usage Comparison">
-                </div>
-                <div class="chart">
-                    <h3>Success Rate Comparison</h3>
-                    <img src="charts/success_rate_comparison.png" alt="Success Rate Comparison">
-                </div>
-            </div>
-        """
-    else:
-        html += """
+    # Add chart section, linking the generated chart images or embedding
+    # them when they were rendered inline
+    charts = charts or {}
+    parts.append("""
             <div class="charts">
                 <h2>Performance Charts</h2>
+    """)
+    for filename, heading in (COMPARISON_CHARTS if comparison_df is not None else CLUSTER_CHARTS):
+        parts.append(f"""
                 <div class="chart">
-                    <h3>Execution Time by Query</h3>
-                    <img src="charts/execution_time.png" alt="Execution Time by Query">
-                </div>
-                <div class="chart">
-                    <h3>Memory Usage by Query</h3>
-                    <img src="charts/memory_usage.png" alt="Memory Usage by Query">
-                </div>
-                <div class="chart">
-                    <h3>CPU Usage by Query</h3>
-                    <img src="charts/cpu_usage.png" alt="CPU Usage by Query">
-                </div>
-                <div class="chart">
-                    <h3>Success Rate by Query</h3>
-                    <img src="charts/success_rate.png" alt="Success Rate by Query">
+                    <h3>{heading}</h3>
+                    <img src="{charts.get(filename, f'charts/{filename}')}" alt="{heading}">
                 </div>
+        """)
+    parts.append("""
             </div>
-        """
+    """)
     
     # Close HTML tags
-    html += """
+    parts.append("""
     </body>
     </html>
-    """
+    """)
     
     # Write HTML to file
     with open(output_file, 'w') as f:
-        f.write(html)
+        f.write("".join(parts))
     
     logger.info(f"Generated HTML report: {output_file}")
 
+def write_table(df: pd.DataFrame, path_base: str):
+    """
+    Write a report table as CSV and as zstd-compressed Parquet
+    
+    Args:
+        df (pd.DataFrame): Table to write
+        path_base (str): Output path without extension
+    """
+    df.to_csv(f"{path_base}.csv")
+    df.to_parquet(f"{path_base}.parquet", compression="zstd")
+
 def main():
     """Main function to generate performance reports"""
     parser = argparse.ArgumentParser(description="Generate performance reports from benchmark results")
@@ -442,14 +511,29 @@ def main():
     parser.add_argument("--results-b", help="Path to results CSV file for cluster B (for comparison)")
     parser.add_argument("--output-dir", default="./reports", help="Output directory for reports")
     parser.add_argument("--title", default="Dremio Benchmark Report", help="Report title")
+    parser.add_argument("--inline-charts", action="store_true",
+                        help="Embed charts in the HTML report instead of writing chart images")
     
     args = parser.parse_args()
     
+    # Configure logging here rather than at import, so importing the report
+    # functions does not attach handlers to the root logger
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("report_generation.log"),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    
     logger.info("Starting report generation...")
     
     # Create output directory if it doesn't exist
     os.makedirs(args.output_dir, exist_ok=True)
-    os.makedirs(os.path.join(args.output_dir, "charts"), exist_ok=True)
+    charts_dir = os.path.join(args.output_dir, "charts")
+    if not args.inline_charts:
+        os.makedirs(charts_dir, exist_ok=True)
     
     # Load benchmark results for cluster A
     df_a = load_benchmark_results(args.results_a)
@@ -457,8 +541,10 @@ def main():
     # Generate summary statistics for cluster A
     summary_a = generate_summary_statistics(df_a)
     
-    # Generate charts for cluster A
-    generate_charts(summary_a, os.path.join(args.output_dir, "charts"))
+    # Generate charts for cluster A, collecting the inline images the HTML
+    # report needs
+    charts = {}
+    charts.update(generate_charts(summary_a, charts_dir, inline=args.inline_charts))
     
     # Initialize comparison DataFrame
     comparison_df = None
@@ -466,27 +552,30 @@ def main():
     # Load benchmark results for cluster B if provided
     if args.results_b:
         df_b = load_benchmark_results(args.results_b)
+        summary_b = generate_summary_statistics(df_b)
         
-        # Generate comparison report
-        comparison_df = generate_comparison_report(df_a, df_b, f"{args.title} - Comparison")
+        # Generate comparison report from the summaries computed once per cluster
+        comparison_df = generate_comparison_report(summary_a, summary_b, f"{args.title} - Comparison")
         
         # Generate comparison charts
-        generate_comparison_charts(comparison_df, os.path.join(args.output_dir, "charts"))
+        charts.update(generate_comparison_charts(comparison_df, charts_dir, inline=args.inline_charts))
+    
+    # Generate CSV reports, plus typed Parquet copies that downstream
+    # tooling can load without re-parsing text
+    write_table(summary_a, os.path.join(args.output_dir, "summary_a"))
+    
+    if comparison_df is not None:
+        write_table(comparison_df, os.path.join(args.output_dir, "comparison"))
     
     # Generate HTML report
     generate_html_report(
         summary_df=summary_a,
         comparison_df=comparison_df,
         output_file=os.path.join(args.output_dir, "report.html"),
-        title=args.title
+        title=args.title,
+        charts=charts
     )
     
-    # Generate CSV reports
-    summary_a.to_csv(os.path.join(args.output_dir, "summary_a.csv"))
-    
-    if comparison_df is not None:
-        comparison_df.to_csv(os.path.join(args.output_dir, "comparison.csv"))
-    
     logger.info(f"Report generation completed. Reports saved to {args.output_dir}")
 
 if __name__ == "__main__":
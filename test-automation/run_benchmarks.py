@@ -5,15 +5,19 @@ Dremio Benchmark Automation Script
 This script automates the process of running TPC-DS queries against Dremio clusters and collecting performance metrics.
 """
 
-import requests
 import json
 import time
 import csv
 import os
+import sys
 import argparse
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.http import POLL_BACKOFF_FACTOR, POLL_INITIAL_INTERVAL, create_session
 
 # Configure logging
 logging.basicConfig(
@@ -27,7 +31,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class DremioBenchmark:
-    def __init__(self, host, port, username, password, use_ssl=True):
+    def __init__(self, host, port, username, password, use_ssl=True, max_retries=3, pool_size=10):
         """Initialize Dremio benchmark client"""
         self.host = host
         self.port = port
@@ -35,9 +39,12 @@ class DremioBenchmark:
         self.username = username
         self.password = password
         self.token = None
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        # One session for the whole run so connections are reused across queries;
+        # retries of failed requests are handled by the session adapter
+        self.session = create_session(max_retries=max_retries, pool_size=pool_size)
+        # Headers live on the session so they are sent with every request
+        # without being merged into a per-call dict
+        self.session.headers.update({"Content-Type": "application/json"})
         
     def login(self):
         """Authenticate with Dremio and get a token"""
@@ -48,10 +55,10 @@ class DremioBenchmark:
         }
         
         try:
-            response = requests.post(login_url, headers=self.headers, json=payload)
+            response = self.session.post(login_url, json=payload)
             response.raise_for_status()
             self.token = response.json()["token"]
-            self.headers["Authorization"] = f"_dremio{self.token}"
+            self.session.headers["Authorization"] = f"_dremio{self.token}"
             logger.info(f"Successfully authenticated to Dremio at {self.host}")
             return True
         except Exception as e:
@@ -69,12 +76,12 @@ class DremioBenchmark:
             "sql": query
         }
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         job_id = None
         
         try:
             # Submit the query
-            response = requests.post(sql_url, headers=self.headers, json=payload)
+            response = self.session.post(sql_url, json=payload)
             response.raise_for_status()
             result = response.json()
             job_id = result.get("id")
@@ -82,7 +89,7 @@ class DremioBenchmark:
             # Poll for job completion
             job_status = self._poll_job_status(job_id)
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
             
             # Collect metrics
@@ -108,7 +115,7 @@ class DremioBenchmark:
             
             return metrics
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
             logger.error(f"Error running query: {str(e)}")
             return {
@@ -122,13 +129,20 @@ class DremioBenchmark:
             }
     
     def _poll_job_status(self, job_id, timeout=3600, interval=1):
-        """Poll for job status until completion or timeout"""
+        """
+        Poll for job status until completion or timeout
+        
+        The polling interval grows exponentially from POLL_INITIAL_INTERVAL up
+        to `interval` seconds. The cap is kept at one second so that measured
+        execution times are no coarser than before.
+        """
         job_url = f"{self.base_url}/job/{job_id}"
-        start_time = time.time()
+        start_time = time.monotonic()
+        delay = min(POLL_INITIAL_INTERVAL, interval)
         
         while True:
             try:
-                response = requests.get(job_url, headers=self.headers)
+                response = self.session.get(job_url)
                 response.raise_for_status()
                 job_status = response.json()
                 
@@ -136,11 +150,12 @@ class DremioBenchmark:
                     return job_status
                 
                 # Check timeout
-                if time.time() - start_time > timeout:
+                if time.monotonic() - start_time > timeout:
                     logger.warning(f"Job {job_id} timed out after {timeout} seconds")
                     return {"jobState": "TIMEOUT"}
                 
-                time.sleep(interval)
+                time.sleep(delay)
+                delay = min(delay * POLL_BACKOFF_FACTOR, interval)
             except Exception as e:
                 logger.error(f"Error checking job status: {str(e)}")
                 return {"jobState": "ERROR", "error": str(e)}
@@ -150,7 +165,7 @@ class DremioBenchmark:
         profile_url = f"{self.base_url}/job/{job_id}/profile"
         
         try:
-            response = requests.get(profile_url, headers=self.headers)
+            response = self.session.get(profile_url)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -160,24 +175,24 @@ class DremioBenchmark:
 def load_queries(query_dir):
     """Load TPC-DS queries from files"""
     queries = {}
-    for filename in os.listdir(query_dir):
-        if filename.endswith(".sql"):
-            query_name = os.path.splitext(filename)[0]
-            with open(os.path.join(query_dir, filename), 'r') as f:
-                query_text = f.read()
-                queries[query_name] = query_text
+    with os.scandir(query_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".sql") and entry.is_file():
+                query_name = entry.name[:-len(".sql")]
+                with open(entry.path, 'r') as f:
+                    queries[query_name] = f.read()
     return queries
 
-def run_benchmarks(dremio_client, queries, output_file, concurrency=1, iterations=1):
+def run_benchmarks(dremio_client, queries, output_file, concurrency=1, iterations=1, summary_file=None):
     """Run benchmark queries with specified concurrency and iterations"""
     results = []
+    start_time = time.perf_counter()
     
     def execute_query(query_name, query_text):
         """Execute a single query and return metrics"""
         logger.info(f"Running query {query_name}")
         metrics = dremio_client.run_query(query_text, query_name)
         if metrics:
-            results.append(metrics)
             logger.info(f"Query {query_name} completed in {metrics.get('execution_time', 0):.2f} seconds")
         return metrics
     
@@ -189,15 +204,48 @@ def run_benchmarks(dremio_client, queries, output_file, concurrency=1, iteration
             for query_name, query_text in queries.items():
                 futures.append(executor.submit(execute_query, query_name, query_text))
             
+            # Collect metrics on the main thread in submission order so that
+            # workers never touch the shared results list
             for future in futures:
-                future.result()  # Wait for completion
+                metrics = future.result()
+                if metrics:
+                    results.append(metrics)
     
     # Write results to CSV
     if results:
         write_results_to_csv(results, output_file)
     
+    write_summary(results, time.perf_counter() - start_time, summary_file)
+    
     return results
 
+def write_summary(results, total_time, summary_file=None):
+    """Log a one-line JSON run summary and optionally write it to a file"""
+    completed = [r for r in results if r.get("status") == "COMPLETED"]
+    summary = {
+        "total_time_s": round(total_time, 3),
+        "queries_run": len(results),
+        "completed": len(completed),
+        "failed": sorted({r["query_name"] for r in results if r.get("status") != "COMPLETED"}),
+        "avg_execution_time_s": (
+            round(sum(r["execution_time"] for r in completed) / len(completed), 3)
+            if completed else None
+        )
+    }
+    
+    # Single machine-readable line so automation does not have to parse the log
+    logger.info("SUMMARY %s", json.dumps(summary))
+    
+    if summary_file:
+        try:
+            with open(summary_file, 'w') as f:
+                json.dump(summary, f, indent=2)
+            logger.info(f"Summary written to {summary_file}")
+        except Exception as e:
+            logger.error(f"Error writing summary: {str(e)}")
+    
+    return summary
+
 def write_results_to_csv(results, output_file):
     """Write benchmark results to CSV file"""
     if not results:
@@ -234,6 +282,13 @@ def main():
     parser.add_argument("--concurrency", default=1, type=int, help="Number of concurrent queries")
     parser.add_argument("--iterations", default=1, type=int, help="Number of iterations")
     parser.add_argument("--no-ssl", action="store_true", help="Disable SSL")
+    parser.add_argument(
+        "--max-retries", default=3, type=int,
+        help="Maximum HTTP retries per request. GET and other idempotent requests are retried "
+             "on 429, 502, 503 and 504 responses and on connection or read errors; POST is "
+             "retried only on 429 or 503 with a Retry-After header and on connection failures"
+    )
+    parser.add_argument("--json-summary", help="Optional file to write the JSON run summary to")
     
     args = parser.parse_args()
     
@@ -243,7 +298,10 @@ def main():
         port=args.port,
         username=args.username,
         password=args.password,
-        use_ssl=not args.no_ssl
+        use_ssl=not args.no_ssl,
+        max_retries=args.max_retries,
+        # Keep one pooled connection per concurrent query
+        pool_size=max(args.concurrency, 1)
     )
     
     # Load queries
@@ -256,7 +314,8 @@ def main():
         queries=queries,
         output_file=args.output,
         concurrency=args.concurrency,
-        iterations=args.iterations
+        iterations=args.iterations,
+        summary_file=args.json_summary
     )
 
 if __name__ == "__main__":
@@ -7,11 +7,62 @@ import subprocess
 import logging
 import os
 import shutil
+from collections import deque
 from typing import List, Dict, Optional, Union, Tuple, Callable, Any
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Descriptors opened by Python are non-inheritable (PEP 446), so children do
+# not need every descriptor closed explicitly. Leaving close_fds off on POSIX
+# lets subprocess launch through posix_spawn()/vfork() instead of a full
+# fork() of the parent, and skips closing every descriptor in the child.
+CLOSE_FDS = os.name != "posix"
+
+# Number of trailing output lines kept from a streamed command for diagnostics
+OUTPUT_TAIL_LINES = 200
+
+# Maximum bytes copied per os.copy_file_range call
+COPY_CHUNK_SIZE = 1 << 30
+
+def _copy_file(src: str, dst: str) -> str:
+    """
+    Copy a file and its metadata like shutil.copy2, keeping the data in the kernel.
+    
+    Where os.copy_file_range is available (Linux) the data never passes
+    through user space, and filesystems that support it can clone the
+    extents instead of copying them. Anything it cannot copy (e.g. across
+    filesystems on older kernels) is finished with a regular copy.
+    
+    Args:
+        src: Source file path
+        dst: Destination file or directory path
+        
+    Returns:
+        Destination file path
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    
+    # Opening dst for writing truncates it, so copying a file onto itself
+    # would destroy it; refuse like shutil.copyfile does
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        try:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE):
+                pass
+        except OSError:
+            # Both offsets advanced together, so continue where the kernel stopped
+            shutil.copyfileobj(fsrc, fdst)
+    
+    shutil.copystat(src, dst)
+    return dst
+
 class CommandExecutor:
     """
     Unified command execution system that handles both shell commands and Python-native operations.
@@ -32,7 +83,8 @@ class CommandExecutor:
         self,
         cmd: List[str],
         description: str,
-        capture_output: bool = True
+        capture_output: bool = True,
+        stream_output: bool = False
     ) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Run a shell command with proper logging and error handling.
@@ -41,6 +93,9 @@ class CommandExecutor:
             cmd: Command to run as a list of strings
             description: Description of the command for logging
             capture_output: Whether to capture and return command output
+            stream_output: Forward output to the log line by line while the
+                command runs instead of buffering it until exit. Takes
+                precedence over capture_output; no output is returned.
             
         Returns:
             Tuple containing:
@@ -49,7 +104,11 @@ class CommandExecutor:
             - Standard error (str or None)
         """
         logger.info(f"Running {description}...")
-        logger.debug(f"Command: {' '.join(cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Command: {' '.join(cmd)}")
+        
+        if stream_output:
+            return self._stream_shell_command(cmd, description)
         
         try:
             result = subprocess.run(
@@ -58,26 +117,77 @@ class CommandExecutor:
                 stdout=subprocess.PIPE if capture_output else None,
                 stderr=subprocess.PIPE if capture_output else None,
                 env=self.env,
-                cwd=self.working_dir
+                cwd=self.working_dir,
+                close_fds=CLOSE_FDS,
+                # Decode incrementally while reading instead of copying the
+                # captured bytes into a second, decoded string afterwards
+                encoding='utf-8',
+                errors='replace'
             )
             
-            stdout = result.stdout.decode('utf-8') if capture_output else None
-            stderr = result.stderr.decode('utf-8') if capture_output else None
-            
             logger.info(f"{description} completed successfully")
-            return True, stdout, stderr
+            return True, result.stdout, result.stderr
             
         except subprocess.CalledProcessError as e:
             logger.error(f"{description} failed: {e}")
             if capture_output:
-                logger.error(f"stdout: {e.stdout.decode('utf-8')}")
-                logger.error(f"stderr: {e.stderr.decode('utf-8')}")
-            return False, e.stdout.decode('utf-8') if capture_output else None, e.stderr.decode('utf-8') if capture_output else None
+                logger.error(f"stdout: {e.stdout}")
+                logger.error(f"stderr: {e.stderr}")
+            return False, e.stdout, e.stderr
             
         except Exception as e:
             logger.error(f"Error running {description}: {str(e)}")
             return False, None, str(e)
     
+    def _stream_shell_command(
+        self,
+        cmd: List[str],
+        description: str
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Run a shell command and forward its combined output to the log as it is produced.
+        
+        Memory use stays constant regardless of how much the command prints,
+        and progress of long-running commands is visible while they run. Only
+        the last OUTPUT_TAIL_LINES lines are kept, to explain a failure.
+        
+        Args:
+            cmd: Command to run as a list of strings
+            description: Description of the command for logging
+            
+        Returns:
+            Tuple of success status, None, error message (str or None). On a
+            non-zero exit the error message is the tail of the output.
+        """
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=self.env,
+                cwd=self.working_dir,
+                close_fds=CLOSE_FDS,
+                encoding='utf-8',
+                errors='replace'
+            ) as process:
+                for line in process.stdout:
+                    line = line.rstrip()
+                    logger.info(line)
+                    tail.append(line)
+                returncode = process.wait()
+            
+        except Exception as e:
+            logger.error(f"Error running {description}: {str(e)}")
+            return False, None, str(e)
+        
+        if returncode != 0:
+            logger.error(f"{description} failed with exit code {returncode}")
+            return False, None, "\n".join(tail)
+        
+        logger.info(f"{description} completed successfully")
+        return True, None, None
+    
     def run_python_operation(
         self,
         operation: Callable[..., Any],
@@ -142,7 +252,7 @@ class CommandExecutor:
         """
         src_str, dst_str = str(src), str(dst)
         return self.run_python_operation(
-            shutil.copy2,
+            _copy_file,
             [src_str, dst_str],
             {},
             f"Copying {src_str} to {dst_str}"
@@ -168,12 +278,12 @@ class CommandExecutor:
                 f"Removing directory recursively: {path_str}"
             )
         else:
-            operation = os.rmdir if os.path.isdir(path_str) else os.remove
+            is_dir = os.path.isdir(path_str)
             return self.run_python_operation(
-                operation,
+                os.rmdir if is_dir else os.remove,
                 [path_str],
                 {},
-                f"Removing {'directory' if os.path.isdir(path_str) else 'file'}: {path_str}"
+                f"Removing {'directory' if is_dir else 'file'}: {path_str}"
             )
 
 # For backward compatibility
@@ -181,10 +291,11 @@ def run_command(
     cmd: List[str],
     description: str,
     env: Optional[Dict[str, str]] = None,
-    cwd: Optional[str] = None
+    cwd: Optional[str] = None,
+    stream_output: bool = False
 ) -> Tuple[bool, Optional[str], Optional[str]]:
     """
     Backward compatibility wrapper for running shell commands.
     """
     executor = CommandExecutor(working_dir=cwd, env=env)
-    return executor.run_shell_command(cmd, description) 
\ No newline at end of file
+    return executor.run_shell_command(cmd, description, stream_output=stream_output) 
\ No newline at end of file
@@ -3,16 +3,195 @@ Configuration utilities for the Dremio benchmark pipeline
 """
 
 import os
-import yaml
+import copy
+import stat
 import logging
-from typing import Dict, Any, Optional, List, Tuple, Union
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+import tempfile
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable
 
 logger = logging.getLogger(__name__)
 
+# Write buffer size in bytes used when saving a configuration
+SAVE_BUFFER_SIZE = 1 << 16
+
+# PyYAML and python-dotenv are imported on first use rather than at import
+# time, so modules that never load a configuration do not pay for them
+_dotenv_loaded = False
+
+def _ensure_dotenv() -> None:
+    """Load environment variables from the .env file, once per process"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
+def _yaml_codec() -> Tuple[Any, type, type]:
+    """
+    Import PyYAML and pick its safe loader and dumper
+    
+    Returns:
+        (yaml module, loader class, dumper class), using the libyaml C
+        extension when PyYAML was built with it
+    """
+    import yaml
+    try:
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:
+        return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+# Bytes read from the start of a file by Config.probe()
+PROBE_BYTES = 8192
+
+# Marks a key path that does not resolve to a value in the configuration
+_NOT_FOUND = object()
+
+# Parsed configuration files keyed by (real path, mtime in ns, size), so a
+# file that has not changed is neither re-read nor re-parsed. Least recently
+# used entries are evicted beyond PARSE_CACHE_SIZE, which also drops the
+# stale entries left behind when a file is edited.
+PARSE_CACHE_SIZE = 64
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+
+def _parse_yaml_file(config_file: str) -> Dict[str, Any]:
+    """
+    Parse a YAML file, reusing the result while the file is unchanged
+    
+    Args:
+        config_file: Path to YAML file
+    
+    Returns:
+        Parsed configuration dictionary (a private copy for the caller)
+    """
+    stat = os.stat(config_file)
+    key = (os.path.realpath(config_file), stat.st_mtime_ns, stat.st_size)
+    if key in _PARSE_CACHE:
+        _PARSE_CACHE.move_to_end(key)
+    else:
+        yaml, loader, _ = _yaml_codec()
+        with open(config_file, 'rb') as f:
+            _PARSE_CACHE[key] = yaml.load(f.read(), Loader=loader) or {}
+        if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    
+    # Callers modify the result (e.g. environment overrides), so never hand
+    # out the cached object itself
+    return copy.deepcopy(_PARSE_CACHE[key])
+
+# Dotted configuration keys split into key paths, shared by every Config so
+# the split survives cache invalidation and happens once per distinct key
+_KEY_PATHS: Dict[str, Tuple[str, ...]] = {}
+
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a dotted configuration key into its key path
+    
+    Args:
+        key: Configuration key (can use dot notation for nested keys)
+    
+    Returns:
+        Key path, one key per nesting level
+    """
+    try:
+        return _KEY_PATHS[key]
+    except KeyError:
+        path = _KEY_PATHS[key] = tuple(key.split("."))
+        return path
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value"""
+    return value.lower() in ["true", "yes", "1"]
+
+def _parse_int_list(value: str) -> List[int]:
+    """Parse a comma-separated list of integers"""
+    return [int(item) for item in value.split(",")]
+
+def _parse_str_list(value: str) -> List[str]:
+    """Parse a comma-separated list of strings"""
+    return [item.strip() for item in value.split(",")]
+
+# Prefix shared by every supported override variable
+_ENV_PREFIX = "DREMIO_"
+
+# Environment variables that override configuration values, mapped to
+# (key path, converter). Built once at import so applying the overrides is
+# a single pass; converters raise ValueError on bad input.
+_ENV_OVERRIDES: Dict[str, Tuple[Tuple[str, ...], Callable[[str], Any]]] = {
+    **{
+        f"DREMIO_{cluster.upper()}_{setting.upper()}": (("clusters", cluster, setting), converter)
+        for cluster in ("dremio_a", "dremio_b")
+        for setting, converter in (
+            ("host", str), ("port", int), ("username", str), ("password", str), ("ssl", _parse_bool)
+        )
+    },
+    "DREMIO_KERBERIZED_PRINCIPAL": (("hdfs", "kerberized", "principal"), str),
+    "DREMIO_KERBERIZED_KEYTAB": (("hdfs", "kerberized", "keytab"), str),
+    "DREMIO_KERBERIZED_HADOOP_BIN": (("hdfs", "kerberized", "hadoop_bin"), str),
+    "DREMIO_KERBERIZED_HADOOP_CONF": (("hdfs", "kerberized", "hadoop_conf"), str),
+    "DREMIO_SIMPLE_AUTH_USER": (("hdfs", "simple_auth", "user"), str),
+    "DREMIO_SIMPLE_AUTH_HADOOP_BIN": (("hdfs", "simple_auth", "hadoop_bin"), str),
+    "DREMIO_SIMPLE_AUTH_HADOOP_CONF": (("hdfs", "simple_auth", "hadoop_conf"), str),
+    "DREMIO_HDFS_TARGET_DIR": (("pipeline", "hdfs_target_dir"), str),
+    "DREMIO_QUERY_DIR": (("pipeline", "query_dir"), str),
+    "DREMIO_QUERY_TIMEOUT_SECONDS": (("pipeline", "timeout_seconds"), int),
+    "DREMIO_BENCHMARK_ITERATIONS": (("pipeline", "num_iterations"), int),
+    "DREMIO_SCALE_FACTORS": (("pipeline", "scale_factors"), _parse_int_list),
+    "DREMIO_FORMATS": (("pipeline", "formats"), _parse_str_list),
+    "DREMIO_DSDGEN_PATH": (("data_generation", "dsdgen_path"), str)
+}
+
+# Configuration sections holding overridable values, parents first
+_ENV_OVERRIDE_SECTIONS: Tuple[Tuple[str, ...], ...] = tuple(dict.fromkeys(
+    path[:depth] for path, _ in _ENV_OVERRIDES.values() for depth in range(1, len(path))
+))
+
+# Settings each pipeline step requires, as (dotted key path, error message)
+_CLUSTER_HOSTS_REQUIRED = (
+    ("clusters.dremio_a.host", "clusters.dremio_a.host is required"),
+    ("clusters.dremio_b.host", "clusters.dremio_b.host is required")
+)
+_REQUIRED_SETTINGS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "data": (
+        ("data_generation.dsdgen_path", "data_generation.dsdgen_path is required for data generation step"),
+    ),
+    "upload": (
+        ("hdfs.simple_auth.hadoop_conf", "hdfs.simple_auth.hadoop_conf is required for upload step"),
+        ("hdfs.kerberized.hadoop_conf", "hdfs.kerberized.hadoop_conf is required for upload step"),
+        ("hdfs.kerberized.keytab", "hdfs.kerberized.keytab is required for upload step"),
+        ("hdfs.kerberized.principal", "hdfs.kerberized.principal is required for upload step")
+    ),
+    "ddl": _CLUSTER_HOSTS_REQUIRED,
+    "cross": _CLUSTER_HOSTS_REQUIRED,
+    "benchmark": _CLUSTER_HOSTS_REQUIRED + (
+        ("pipeline.query_dir", "pipeline.query_dir is required for benchmark step"),
+    )
+}
+
+# The same requirements with their key paths split once at import
+_REQUIRED_PATHS: Dict[str, Tuple[Tuple[Tuple[str, ...], str], ...]] = {
+    step: tuple((tuple(key.split(".")), message) for key, message in settings)
+    for step, settings in _REQUIRED_SETTINGS.items()
+}
+
+def _get_path(config: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """
+    Look up a key path in a configuration dictionary
+    
+    Args:
+        config: Configuration dictionary
+        path: Key path, one key per nesting level
+    
+    Returns:
+        Value at the path, or None if any part of it is missing
+    """
+    value = config
+    for part in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
 class Config:
     """Configuration manager for the Dremio benchmark pipeline"""
     
@@ -24,6 +203,10 @@ class Config:
             config_file: Path to YAML configuration file
         """
         self.config_data = {}
+        # Resolved values of get() keyed by key path, and results of
+        # validate() keyed by step; both are cleared on every change
+        self._get_cache: Dict[str, Any] = {}
+        self._validation_cache: Dict[str, Tuple[bool, List[str]]] = {}
         if config_file:
             self.load_from_file(config_file)
     
@@ -42,8 +225,7 @@ class Config:
             return False
         
         try:
-            with open(config_file, 'r') as f:
-                self.config_data = yaml.safe_load(f) or {}
+            self.config_data = _parse_yaml_file(config_file)
             
             # Apply environment variable overrides
             self._apply_environment_overrides()
@@ -54,142 +236,97 @@ class Config:
         except Exception as e:
             logger.error(f"Failed to load configuration from {config_file}: {e}")
             return False
+        
+        finally:
+            # config_data may have been replaced even if loading failed, so
+            # memoized lookups of the previous data must never be served
+            self._invalidate_caches()
     
-    def _apply_environment_overrides(self) -> None:
-        """Apply environment variable overrides to the configuration"""
-        self._override_cluster_config()
-        self._override_hdfs_config()
-        self._override_pipeline_config()
-        self._override_data_generation_config()
-    
-    def _override_cluster_config(self) -> None:
-        """Override Dremio cluster configuration from environment variables"""
-        if "clusters" not in self.config_data:
-            self.config_data["clusters"] = {}
-            
-        for cluster in ["dremio_a", "dremio_b"]:
-            if cluster not in self.config_data["clusters"]:
-                self.config_data["clusters"][cluster] = {}
-                
-            cluster_config = self.config_data["clusters"][cluster]
-            
-            # Override host
-            env_var = f"DREMIO_{cluster.upper()}_HOST"
-            if env_var in os.environ:
-                cluster_config["host"] = os.environ[env_var]
-            
-            # Override port
-            env_var = f"DREMIO_{cluster.upper()}_PORT"
-            if env_var in os.environ:
-                try:
-                    cluster_config["port"] = int(os.environ[env_var])
-                except ValueError:
-                    logger.warning(f"Invalid port in {env_var}: {os.environ[env_var]}")
-            
-            # Override username
-            env_var = f"DREMIO_{cluster.upper()}_USERNAME"
-            if env_var in os.environ:
-                cluster_config["username"] = os.environ[env_var]
-            
-            # Override password
-            env_var = f"DREMIO_{cluster.upper()}_PASSWORD"
-            if env_var in os.environ:
-                cluster_config["password"] = os.environ[env_var]
-            
-            # Override SSL
-            env_var = f"DREMIO_{cluster.upper()}_SSL"
-            if env_var in os.environ:
-                ssl_value = os.environ[env_var].lower()
-                cluster_config["ssl"] = ssl_value in ["true", "yes", "1"]
-    
-    def _override_hdfs_config(self) -> None:
-        """Override HDFS configuration from environment variables"""
-        if "hdfs" not in self.config_data:
-            self.config_data["hdfs"] = {}
-        
-        # Kerberized HDFS configuration
-        if "kerberized" not in self.config_data["hdfs"]:
-            self.config_data["hdfs"]["kerberized"] = {}
-            
-        kerberized_config = self.config_data["hdfs"]["kerberized"]
+    @staticmethod
+    def probe(config_file: str, keys: List[str], max_bytes: int = PROBE_BYTES) -> bool:
+        """
+        Check that a configuration file sets the given keys, cheaply when possible
         
-        if "DREMIO_KERBERIZED_PRINCIPAL" in os.environ:
-            kerberized_config["principal"] = os.environ["DREMIO_KERBERIZED_PRINCIPAL"]
-            
-        if "DREMIO_KERBERIZED_KEYTAB" in os.environ:
-            kerberized_config["keytab"] = os.environ["DREMIO_KERBERIZED_KEYTAB"]
-            
-        if "DREMIO_KERBERIZED_HADOOP_BIN" in os.environ:
-            kerberized_config["hadoop_bin"] = os.environ["DREMIO_KERBERIZED_HADOOP_BIN"]
-            
-        if "DREMIO_KERBERIZED_HADOOP_CONF" in os.environ:
-            kerberized_config["hadoop_conf"] = os.environ["DREMIO_KERBERIZED_HADOOP_CONF"]
+        A file of at most max_bytes is read with a single bounded read and
+        parsed directly, skipping the parse cache, its deep copy and the load
+        logging. Larger files are loaded in full. Either way the .env file and
+        environment overrides are applied, so the answer is the same as
+        checking a Config loaded from the file.
         
-        # Simple auth HDFS configuration
-        if "simple_auth" not in self.config_data["hdfs"]:
-            self.config_data["hdfs"]["simple_auth"] = {}
-            
-        simple_auth_config = self.config_data["hdfs"]["simple_auth"]
+        Args:
+            config_file: Path to YAML configuration file
+            keys: Configuration keys (can use dot notation for nested keys)
+            max_bytes: Largest file size handled on the fast path
         
-        if "DREMIO_SIMPLE_AUTH_USER" in os.environ:
-            simple_auth_config["user"] = os.environ["DREMIO_SIMPLE_AUTH_USER"]
-            
-        if "DREMIO_SIMPLE_AUTH_HADOOP_BIN" in os.environ:
-            simple_auth_config["hadoop_bin"] = os.environ["DREMIO_SIMPLE_AUTH_HADOOP_BIN"]
+        Returns:
+            True if every key has a non-empty value, False otherwise
+        """
+        config = Config()
+        try:
+            with open(config_file, 'rb') as f:
+                buf = f.read(max_bytes + 1)
             
-        if "DREMIO_SIMPLE_AUTH_HADOOP_CONF" in os.environ:
-            simple_auth_config["hadoop_conf"] = os.environ["DREMIO_SIMPLE_AUTH_HADOOP_CONF"]
+            # Only the whole file gives the same answer as a full load; a
+            # prefix could miss keys or later duplicates that override them
+            if len(buf) <= max_bytes:
+                yaml, loader, _ = _yaml_codec()
+                config.config_data = yaml.load(buf, Loader=loader) or {}
+                config._apply_environment_overrides()
+                return all(config.get(key) for key in keys)
+        except Exception as e:
+            logger.debug(f"Falling back to a full load of {config_file}: {e}")
+        
+        if not config.load_from_file(config_file):
+            return False
+        return all(config.get(key) for key in keys)
     
-    def _override_pipeline_config(self) -> None:
-        """Override pipeline configuration from environment variables"""
-        if "pipeline" not in self.config_data:
-            self.config_data["pipeline"] = {}
-            
-        pipeline_config = self.config_data["pipeline"]
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget every parsed configuration file, forcing the next load to re-read it"""
+        _PARSE_CACHE.clear()
+    
+    def _invalidate_caches(self) -> None:
+        """Drop memoized lookups and validation results after a change"""
+        self._get_cache.clear()
+        self._validation_cache.clear()
+    
+    def _apply_environment_overrides(self) -> None:
+        """Apply environment variable overrides to the configuration"""
+        _ensure_dotenv()
         
-        if "DREMIO_HDFS_TARGET_DIR" in os.environ:
-            pipeline_config["hdfs_target_dir"] = os.environ["DREMIO_HDFS_TARGET_DIR"]
-            
-        if "DREMIO_QUERY_DIR" in os.environ:
-            pipeline_config["query_dir"] = os.environ["DREMIO_QUERY_DIR"]
+        # Every section that can be overridden exists afterwards, even when
+        # none of its variables are set
+        for section_path in _ENV_OVERRIDE_SECTIONS:
+            section = self.config_data
+            for key in section_path:
+                section = section.setdefault(key, {})
+        
+        # One scan of the environment picks out the candidate variables,
+        # instead of probing it once for every supported override
+        for env_var, value in os.environ.items():
+            if not env_var.startswith(_ENV_PREFIX) or env_var not in _ENV_OVERRIDES:
+                continue
             
-        if "DREMIO_QUERY_TIMEOUT_SECONDS" in os.environ:
+            path, converter = _ENV_OVERRIDES[env_var]
             try:
-                pipeline_config["timeout_seconds"] = int(os.environ["DREMIO_QUERY_TIMEOUT_SECONDS"])
+                converted = converter(value)
             except ValueError:
-                logger.warning(f"Invalid timeout: {os.environ['DREMIO_QUERY_TIMEOUT_SECONDS']}")
-                
-        if "DREMIO_BENCHMARK_ITERATIONS" in os.environ:
-            try:
-                pipeline_config["num_iterations"] = int(os.environ["DREMIO_BENCHMARK_ITERATIONS"])
-            except ValueError:
-                logger.warning(f"Invalid iterations: {os.environ['DREMIO_BENCHMARK_ITERATIONS']}")
-                
-        if "DREMIO_SCALE_FACTORS" in os.environ:
-            try:
-                scale_factors = [int(sf) for sf in os.environ["DREMIO_SCALE_FACTORS"].split(",")]
-                pipeline_config["scale_factors"] = scale_factors
-            except ValueError:
-                logger.warning(f"Invalid scale factors: {os.environ['DREMIO_SCALE_FACTORS']}")
-                
-        if "DREMIO_FORMATS" in os.environ:
-            formats = [fmt.strip() for fmt in os.environ["DREMIO_FORMATS"].split(",")]
-            pipeline_config["formats"] = formats
-    
-    def _override_data_generation_config(self) -> None:
-        """Override data generation configuration from environment variables"""
-        if "data_generation" not in self.config_data:
-            self.config_data["data_generation"] = {}
+                logger.warning(f"Invalid value in {env_var}: {value}")
+                continue
             
-        data_gen_config = self.config_data["data_generation"]
-        
-        if "DREMIO_DSDGEN_PATH" in os.environ:
-            data_gen_config["dsdgen_path"] = os.environ["DREMIO_DSDGEN_PATH"]
+            section = self.config_data
+            for key in path[:-1]:
+                section = section[key]
+            section[path[-1]] = converted
     
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value
         
+        Lookups are memoized per key and the cache is cleared by set(),
+        merge() and load_from_file(). Changes made to config_data directly
+        are not seen by get() until one of those is called.
+        
         Args:
             key: Configuration key (can use dot notation for nested keys)
             default: Default value if key is not found
@@ -197,20 +334,38 @@ class Config:
         Returns:
             Configuration value or default
         """
+        try:
+            value = self._get_cache[key]
+        except KeyError:
+            value = self._get_cache[key] = self._lookup(key)
+        
+        return default if value is _NOT_FOUND else value
+    
+    def _lookup(self, key: str) -> Any:
+        """
+        Resolve a configuration key against the configuration data
+        
+        Args:
+            key: Configuration key (can use dot notation for nested keys)
+            
+        Returns:
+            Configuration value or _NOT_FOUND
+        """
         if "." in key:
-            # Handle nested keys with dot notation
-            keys = key.split(".")
+            # Handle nested keys with dot notation. Indexing a missing key
+            # raises KeyError and indexing a non-dict (e.g. a string or list)
+            # raises TypeError, so no type or membership check is needed
             value = self.config_data
             
-            for k in keys:
-                if isinstance(value, dict) and k in value:
+            try:
+                for k in _split_key(key):
                     value = value[k]
-                else:
-                    return default
+            except (KeyError, TypeError):
+                return _NOT_FOUND
                     
             return value
         
-        return self.config_data.get(key, default)
+        return self.config_data.get(key, _NOT_FOUND)
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -220,9 +375,11 @@ class Config:
             key: Configuration key (can use dot notation for nested keys)
             value: Value to set
         """
+        self._invalidate_caches()
+        
         if "." in key:
             # Handle nested keys with dot notation
-            keys = key.split(".")
+            keys = _split_key(key)
             data = self.config_data
             
             # Navigate to the parent object
@@ -278,8 +435,39 @@ class Config:
             if output_dir:
                 os.makedirs(output_dir, exist_ok=True)
             
-            with open(output_file, 'w') as f:
-                yaml.dump(self.config_data, f, default_flow_style=False)
+            # The emitter issues many small writes, so dump encoded bytes
+            # through a large buffer into a uniquely named sibling file and
+            # rename it into place; concurrent readers never see a partially
+            # written file and concurrent writers never share a temp file.
+            # Keys keep their configuration order instead of being sorted.
+            yaml, _, dumper = _yaml_codec()
+            try:
+                mode = stat.S_IMODE(os.stat(output_file).st_mode)
+            except FileNotFoundError:
+                # A new configuration keeps the temp file's private mode (0600)
+                mode = None
+            
+            tmp = tempfile.NamedTemporaryFile(
+                dir=output_dir or ".",
+                prefix=f"{os.path.basename(output_file)}.",
+                suffix=".tmp",
+                delete=False,
+                buffering=SAVE_BUFFER_SIZE
+            )
+            try:
+                with tmp:
+                    yaml.dump(
+                        self.config_data, tmp, Dumper=dumper,
+                        default_flow_style=False, sort_keys=False, encoding='utf-8'
+                    )
+                # Keep the permissions of the file being replaced
+                if mode is not None:
+                    os.chmod(tmp.name, mode)
+                os.replace(tmp.name, output_file)
+            except BaseException:
+                if os.path.exists(tmp.name):
+                    os.remove(tmp.name)
+                raise
             
             logger.info(f"Configuration saved to {output_file}")
             return True
@@ -292,57 +480,39 @@ class Config:
         """
         Validate configuration for a specific pipeline step
         
+        Results are cached per step until the configuration changes.
+        
         Args:
             step: Pipeline step to validate
         
         Returns:
             (is_valid, error_messages)
         """
-        errors = []
+        if step not in self._validation_cache:
+            self._validation_cache[step] = self._validate_uncached(step)
+        
+        is_valid, errors = self._validation_cache[step]
+        return is_valid, list(errors)
+    
+    def _validate_uncached(self, step: str) -> Tuple[bool, List[str]]:
+        """
+        Validate configuration for a specific pipeline step without caching
+        
+        Args:
+            step: Pipeline step to validate
         
+        Returns:
+            (is_valid, error_messages)
+        """
         # Common validations
         if not self.config_data:
-            errors.append("Configuration is empty")
-            return False, errors
+            return False, ["Configuration is empty"]
         
         # Step-specific validations
-        if step == "data":
-            data_gen_config = self.config_data.get("data_generation", {})
-            if not data_gen_config.get("dsdgen_path"):
-                errors.append("data_generation.dsdgen_path is required for data generation step")
-        
-        elif step == "upload":
-            # Validate HDFS configs
-            simple_auth = self.get_hdfs_config("simple_auth")
-            kerberized = self.get_hdfs_config("kerberized")
-            
-            if not simple_auth.get("hadoop_conf"):
-                errors.append("hdfs.simple_auth.hadoop_conf is required for upload step")
-            
-            if not kerberized.get("hadoop_conf"):
-                errors.append("hdfs.kerberized.hadoop_conf is required for upload step")
-                
-            if not kerberized.get("keytab"):
-                errors.append("hdfs.kerberized.keytab is required for upload step")
-                
-            if not kerberized.get("principal"):
-                errors.append("hdfs.kerberized.principal is required for upload step")
-        
-        elif step in ["ddl", "cross", "benchmark"]:
-            # Validate Dremio configs
-            dremio_a = self.get_cluster_config("dremio_a")
-            dremio_b = self.get_cluster_config("dremio_b")
-            
-            if not dremio_a.get("host"):
-                errors.append("clusters.dremio_a.host is required")
-                
-            if not dremio_b.get("host"):
-                errors.append("clusters.dremio_b.host is required")
-                
-            if step == "benchmark":
-                pipeline_config = self.config_data.get("pipeline", {})
-                if not pipeline_config.get("query_dir"):
-                    errors.append("pipeline.query_dir is required for benchmark step")
+        errors = [
+            message for path, message in _REQUIRED_PATHS.get(step, ())
+            if not _get_path(self.config_data, path)
+        ]
         
         return len(errors) == 0, errors
     
@@ -354,6 +524,7 @@ class Config:
             override_config: Override configuration
         """
         self.config_data = merge_configs(self.config_data, override_config)
+        self._invalidate_caches()
     
     def get_all(self) -> Dict[str, Any]:
         """
@@ -423,6 +594,11 @@ def merge_configs(
     """
     Merge two configuration dictionaries
     
+    Neither input is modified. The result is a new dictionary, but it shares
+    structure with the inputs: nested sections the override does not touch
+    and values taken from the override are the same objects rather than
+    copies, so they must not be mutated through the result.
+    
     Args:
         base_config: Base configuration
         override_config: Override configuration
@@ -432,11 +608,18 @@ def merge_configs(
     """
     result = base_config.copy()
     
-    for key, value in override_config.items():
-        if isinstance(value, dict) and key in result and isinstance(result[key], dict):
-            result[key] = merge_configs(result[key], value)
-        else:
-            result[key] = value
+    # Walk nested sections with an explicit stack instead of recursing. Only
+    # the dictionaries along merged paths are copied.
+    stack = [(result, override_config)]
+    while stack:
+        target, override = stack.pop()
+        for key, value in override.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                merged = target[key] = current.copy()
+                stack.append((merged, value))
+            else:
+                target[key] = value
     
     return result
 
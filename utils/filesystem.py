@@ -3,9 +3,11 @@ Filesystem utilities for the Dremio benchmark pipeline
 """
 
 import os
+import stat
 import shutil
 import logging
-from typing import Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, List, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -23,54 +25,122 @@ def create_directories(
     Returns:
         Dict[str, str]: Dictionary of absolute directory paths
     """
-    directories = {}
+    directories = {
+        name: os.path.join(base_dir, rel_path) for name, rel_path in subdirs.items()
+    }
     
     # Create base directory if it doesn't exist
     os.makedirs(base_dir, exist_ok=True)
     
-    # Create subdirectories
-    for name, rel_path in subdirs.items():
-        abs_path = os.path.join(base_dir, rel_path)
+    # Names of the subdirectories already present in each parent directory,
+    # listed once per parent instead of probing every path
+    existing: Dict[str, set] = {}
+    
+    def list_subdirs(parent: str) -> set:
+        if parent not in existing:
+            try:
+                with os.scandir(parent) as entries:
+                    existing[parent] = {entry.name for entry in entries if entry.is_dir()}
+            except FileNotFoundError:
+                existing[parent] = set()
+        return existing[parent]
+    
+    # Create subdirectories, shallowest first so that a parent created here
+    # is already known when its children are checked
+    for abs_path in sorted(dict.fromkeys(directories.values()), key=lambda path: os.path.normpath(path).count(os.sep)):
+        parent, leaf = os.path.split(os.path.normpath(abs_path))
+        subdir_names = list_subdirs(parent)
+        if leaf in subdir_names:
+            continue
+        
         os.makedirs(abs_path, exist_ok=True)
+        subdir_names.add(leaf)
         logger.info(f"Created directory: {abs_path}")
-        directories[name] = abs_path
     
     return directories
 
-def clean_directory(directory: str, confirm: bool = True) -> bool:
+def _remove_entry(entry: os.DirEntry) -> Optional[Exception]:
+    """
+    Remove a directory entry, recursing into directories but not symlinks
+    
+    Args:
+        entry (os.DirEntry): Entry to remove
+    
+    Returns:
+        Optional[Exception]: The error if removal failed, None otherwise
+    """
+    try:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
+        return None
+    except OSError as e:
+        return e
+
+def clean_directory(
+    directory: str,
+    confirm: Union[bool, Callable[[], bool]] = True,
+    *,
+    workers: int = 1
+) -> bool:
     """
     Clean a directory by removing its contents
     
     Args:
         directory (str): Directory to clean
-        confirm (bool): Whether to confirm before cleaning
+        confirm (Union[bool, Callable[[], bool]]): Whether to ask on the
+            terminal before cleaning, or a callable that returns whether to
+            proceed (e.g. to confirm many directories at once)
+        workers (int): Number of threads removing top-level entries; removal
+            is I/O bound, so more than one helps for large trees
     
     Returns:
         bool: True if successful, False otherwise
     """
-    if not os.path.exists(directory):
+    # One stat answers both whether the path exists and whether it is a directory
+    try:
+        mode = os.stat(directory).st_mode
+    except FileNotFoundError:
         logger.warning(f"Directory does not exist: {directory}")
         return False
     
-    if not os.path.isdir(directory):
+    if not stat.S_ISDIR(mode):
         logger.error(f"Not a directory: {directory}")
         return False
     
     try:
-        if confirm:
+        if callable(confirm):
+            proceed = confirm()
+        elif confirm:
             logger.warning(f"About to clean directory: {directory}")
-            user_input = input("Are you sure? (y/n): ")
-            if user_input.lower() != 'y':
-                logger.info("Directory cleaning aborted")
-                return False
+            proceed = input("Are you sure? (y/n): ").lower() == 'y'
+        else:
+            proceed = True
+        
+        if not proceed:
+            logger.info("Directory cleaning aborted")
+            return False
         
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            
-            if os.path.isdir(item_path):
-                shutil.rmtree(item_path)
-            else:
-                os.remove(item_path)
+        # scandir reports each entry's type from the directory listing, so
+        # no extra stat is needed per entry
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+        
+        # A failed entry is reported but does not stop the others from
+        # being removed
+        if workers > 1 and len(entries) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                errors = list(executor.map(_remove_entry, entries))
+        else:
+            errors = [_remove_entry(entry) for entry in entries]
+        
+        failed = [(entry, error) for entry, error in zip(entries, errors) if error]
+        for entry, error in failed:
+            logger.error(f"Failed to remove {entry.path}: {error}")
+        if failed:
+            logger.error(f"Failed to clean directory {directory}: {len(failed)} entries could not be removed")
+            return False
         
         logger.info(f"Directory cleaned: {directory}")
         return True
@@ -81,7 +151,7 @@ def clean_directory(directory: str, confirm: bool = True) -> bool:
 
 def get_files_with_extension(
     directory: str, 
-    extension: str,
+    extension: Union[str, Tuple[str, ...]],
     recursive: bool = False
 ) -> List[str]:
     """
@@ -89,15 +159,18 @@ def get_files_with_extension(
     
     Args:
         directory (str): Directory to search
-        extension (str): File extension (with or without '.')
+        extension (Union[str, Tuple[str, ...]]): File extension, or several
+            extensions to match in one pass (each with or without '.')
         recursive (bool): Whether to search recursively
     
     Returns:
         List[str]: List of file paths
     """
-    # Normalize extension to start with a dot if not already
-    if not extension.startswith('.'):
-        extension = f".{extension}"
+    # Normalize extensions to start with a dot if not already; str.endswith
+    # matches a tuple of suffixes in a single call
+    if isinstance(extension, str):
+        extension = (extension,)
+    extension = tuple(ext if ext.startswith('.') else f".{ext}" for ext in extension)
     
     result = []
     
@@ -107,14 +180,13 @@ def get_files_with_extension(
     
     if recursive:
         for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(extension):
-                    result.append(os.path.join(root, file))
+            result.extend(os.path.join(root, file) for file in files if file.endswith(extension))
     else:
-        for file in os.listdir(directory):
-            file_path = os.path.join(directory, file)
-            if os.path.isfile(file_path) and file.endswith(extension):
-                result.append(file_path)
+        with os.scandir(directory) as entries:
+            result = [
+                entry.path for entry in entries
+                if entry.name.endswith(extension) and entry.is_file()
+            ]
     
     return result
 
@@ -159,15 +231,23 @@ def move_file(
 def copy_file(
     source: str, 
     destination: str, 
-    overwrite: bool = False
+    overwrite: bool = False,
+    preserve_metadata: bool = True
 ) -> bool:
     """
     Copy a file from source to destination
     
+    Both modes copy the data the same way (sendfile on Linux); copying only
+    the contents skips the extra chmod/utime/xattr calls that carry the
+    metadata over, for callers that do not need it.
+    
     Args:
         source (str): Source file path
         destination (str): Destination file path
         overwrite (bool): Whether to overwrite if destination exists
+        preserve_metadata (bool): Whether to also copy permission bits,
+            timestamps and extended attributes, like shutil.copy2; pass
+            False to copy only the contents
     
     Returns:
         bool: True if successful, False otherwise
@@ -186,7 +266,10 @@ def copy_file(
         if dest_dir:
             os.makedirs(dest_dir, exist_ok=True)
         
-        shutil.copy2(source, destination)
+        if preserve_metadata:
+            shutil.copy2(source, destination)
+        else:
+            shutil.copyfile(source, destination)
         logger.info(f"Copied file from {source} to {destination}")
         return True
     
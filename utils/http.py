@@ -0,0 +1,132 @@
+"""
+HTTP utilities for talking to the Dremio REST API
+"""
+
+import logging
+import random
+from typing import Iterable, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Throttling and gateway errors that are worth retrying. A 502 or 504 may be
+# returned after the coordinator has already accepted the request, so only
+# idempotent methods are retried on every code here (see below). A 429 or 503
+# carrying a Retry-After header is retried no sooner than the server asks,
+# which lets an overloaded coordinator apply backpressure to the client.
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Idempotent methods, retried on any retryable failure (connection and read
+# errors as well as the status codes above)
+RETRY_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+# Other methods (POST submits a job or creates a user or source) are never
+# retried after a read error or a gateway error, since the coordinator may
+# already have acted on them. They are only retried when refused with one of
+# these status codes and a Retry-After header.
+NON_IDEMPOTENT_RETRY_STATUS_CODES = frozenset([429, 503])
+
+# Default (connect, read) timeout in seconds for requests that do not set one;
+# the REST API answers submissions and status polls promptly, so a request
+# still waiting after this long is treated as hung
+DEFAULT_TIMEOUT = (10, 120)
+
+# Job status polling starts fast so short statements (e.g. DDL) are picked up
+# within tens of milliseconds, then backs off so long-running jobs are not
+# polled needlessly often
+POLL_INITIAL_INTERVAL = 0.05
+POLL_BACKOFF_FACTOR = 1.7
+
+class JitteredRetry(Retry):
+    """
+    Retry policy with full-jitter exponential backoff.
+
+    Concurrent workers that hit the same overloaded coordinator would otherwise
+    back off by identical amounts and retry in lockstep. Sleeping a random time
+    between zero and the exponential backoff spreads the retries out.
+    """
+
+    # Upper bound in seconds for a single backoff sleep
+    BACKOFF_CAP = 30.0
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return random.uniform(0, min(self.BACKOFF_CAP, backoff))
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if self.allowed_methods is not None and method.upper() not in self.allowed_methods:
+            # Not idempotent: only retry when the server refused the request
+            # and said when to come back
+            return bool(
+                self.total
+                and self.respect_retry_after_header
+                and has_retry_after
+                and status_code in NON_IDEMPOTENT_RETRY_STATUS_CODES
+            )
+        return super().is_retry(method, status_code, has_retry_after)
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """Transport adapter that applies a default timeout to every request"""
+    
+    def __init__(self, *args, timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+def create_session(
+    max_retries: int = 3,
+    backoff_factor: float = 0.5,
+    status_forcelist: Iterable[int] = RETRY_STATUS_CODES,
+    pool_size: int = 10,
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT
+) -> requests.Session:
+    """
+    Create an HTTP session whose transport adapter handles retries.
+
+    Retries, backoff and Retry-After handling are done by urllib3 inside the
+    adapter, so callers issue a single request and never loop themselves.
+    A single session should be shared for the lifetime of a client so that
+    TCP/TLS connections are kept alive and reused across requests.
+    
+    Only idempotent methods are retried after connection drops, read errors
+    or gateway errors. POST requests are retried only when throttled with a
+    Retry-After header, so a job is never submitted twice.
+
+    Args:
+        max_retries: Maximum number of retries per request
+        backoff_factor: Backoff factor in seconds; the sleep before retry n is
+            drawn uniformly from [0, backoff_factor * 2 ** (n - 1)]
+        status_forcelist: HTTP status codes that trigger a retry
+        pool_size: Maximum number of pooled connections per host; should be
+            at least the number of threads sharing the session
+        timeout: Default timeout in seconds, or (connect, read) timeouts, for
+            requests that do not pass their own
+
+    Returns:
+        Configured requests session
+    """
+    retry = JitteredRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        # Hand the last response back so raise_for_status() reports it
+        raise_on_status=False
+    )
+    adapter = TimeoutHTTPAdapter(pool_maxsize=pool_size, max_retries=retry, timeout=timeout)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
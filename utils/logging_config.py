@@ -2,15 +2,67 @@
 Centralized logging configuration for the Dremio benchmarking project.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Formatters are shared by every handler this module creates
+FILE_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+CONSOLE_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+# Handlers shared by every logger writing to the same destination at the same
+# level, keyed by (absolute log file path or None for the console, level), so
+# configuring another logger does not open the log file again
+_handlers: Dict[Tuple[Optional[str], int], logging.Handler] = {}
+
+def _get_handler(log_file: Optional[str], level: int) -> logging.Handler:
+    """
+    Get the shared handler for a log file, or for the console
+    
+    Args:
+        log_file: Path to log file, or None for standard output
+        level: Logging level of the handler
+        
+    Returns:
+        Handler writing to the destination
+    """
+    key = (str(Path(log_file).resolve()) if log_file else None, level)
+    handler = _handlers.get(key)
+    if handler is None:
+        if log_file:
+            handler = logging.FileHandler(log_file)
+            handler.setFormatter(FILE_FORMATTER)
+        else:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(CONSOLE_FORMATTER)
+        handler.setLevel(level)
+        _handlers[key] = handler
+    return handler
+
+# Background listeners writing queued records, keyed by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+def _stop_listener(logger_name: str) -> None:
+    """Stop and forget the queue listener of a logger, flushing pending records"""
+    listener = _listeners.pop(logger_name, None)
+    if listener:
+        listener.stop()
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Flush every queued record before the interpreter exits"""
+    for logger_name in list(_listeners):
+        _stop_listener(logger_name)
 
 def setup_logging(
     log_file: Optional[str] = None,
     module_name: Optional[str] = None,
-    level: int = logging.INFO
+    level: int = logging.INFO,
+    use_queue: bool = True
 ) -> logging.Logger:
     """
     Set up logging configuration with consistent formatting.
@@ -19,6 +71,8 @@ def setup_logging(
         log_file: Path to log file. If None, defaults to benchmark.log
         module_name: Name of the module for the logger. If None, uses root logger
         level: Logging level (default: INFO)
+        use_queue: Hand records to a background thread that writes them to the
+            file and console, so logging calls do not block on I/O
         
     Returns:
         Configured logger instance
@@ -35,30 +89,32 @@ def setup_logging(
     logger = logging.getLogger(module_name) if module_name else logging.getLogger()
     logger.setLevel(level)
     
-    # Create formatters
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s'
-    )
+    # Set up file and console handlers, reusing those of other loggers
+    file_handler = _get_handler(log_file, level)
+    console_handler = _get_handler(None, level)
     
-    # Set up file handler
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(file_formatter)
-    file_handler.setLevel(level)
-    
-    # Set up console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(console_formatter)
-    console_handler.setLevel(level)
-    
-    # Remove any existing handlers
+    # Remove any existing handlers; shared handlers stay open for reuse
     logger.handlers = []
+    _stop_listener(logger.name)
     
     # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    if use_queue:
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        _listeners[logger.name] = listener
+        logger.addHandler(QueueHandler(log_queue))
+    else:
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
+    
+    # The logger writes to its own file and console, so its records must not
+    # also reach handlers that step modules install on the root logger (e.g.
+    # with logging.basicConfig), which would print them twice
+    if module_name:
+        logger.propagate = False
     
     return logger
 
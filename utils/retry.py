@@ -0,0 +1,54 @@
+"""
+Retry utilities for pipeline operations that touch remote services
+"""
+
+import functools
+import logging
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+def retry_on_failure(
+    tries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Retry a function that reports failure by returning a falsy value.
+    
+    The sleep before retry n is min(max_delay, base_delay * 2 ** (n - 1)).
+    Only wrap idempotent operations, such as 'hadoop fs -put -f' or
+    'hadoop fs -mkdir -p', so that repeating them after a partial failure is
+    safe.
+    
+    Args:
+        tries: Total number of attempts, including the first
+        base_delay: Delay in seconds before the first retry
+        max_delay: Upper bound in seconds for a single delay
+    
+    Returns:
+        Decorator applying the retry policy
+    
+    Raises:
+        ValueError: If tries is less than 1
+    """
+    if tries < 1:
+        raise ValueError(f"tries must be at least 1, got {tries}")
+    
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(tries):
+                result = func(*args, **kwargs)
+                if result or attempt == tries - 1:
+                    return result
+                
+                delay = min(max_delay, base_delay * 2 ** attempt)
+                logger.warning(
+                    f"{func.__name__} failed (attempt {attempt + 1} of {tries}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            return result
+        return wrapper
+    return decorator